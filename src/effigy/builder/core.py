@@ -1,3 +1,7 @@
+import sys
+import warnings
+from dataclasses import dataclass
+from functools import lru_cache
 from types import UnionType
 from typing import (
     Callable,
@@ -11,6 +15,7 @@ from typing import (
     get_origin,
     Union,
 )
+from weakref import WeakKeyDictionary
 
 from sqlalchemy import MetaData, Table, Column, Integer, String, Boolean, Float
 from sqlalchemy.orm import registry
@@ -18,7 +23,7 @@ from sqlalchemy.orm import registry
 from .index import IndexConfiguration
 from .property import PropertyConfiguration
 from .relationship import RelationshipConfiguration, RelationshipType
-from ..entity import _EntityProxy
+from ..entity import _get_entity_proxy
 
 T = TypeVar("T")
 
@@ -30,47 +35,220 @@ _TYPE_MAP: dict[type, Any] = {
     float: Float,
 }
 
+# origins of collection annotations, which are likely relationships rather than columns
+_SKIP_ORIGINS: frozenset[Any] = frozenset({list, dict, set, frozenset, tuple})
+_NONE_TYPE = type(None)
+
+# unresolved string annotations (e.g. "int"), keyed by type name
+_TYPE_BY_NAME: dict[str, type] = {t.__name__: t for t in _TYPE_MAP}
+
+
+def _external_stacklevel() -> int:
+    """Gets the `stacklevel` that makes a warning point at the first frame outside effigy."""
+    frame = sys._getframe(1)
+    level = 1
+    while frame.f_back is not None:
+        module = frame.f_globals.get("__name__", "")
+        # match the package itself, not other packages whose name starts with "effigy"
+        if module != "effigy" and not module.startswith("effigy."):
+            break
+        frame = frame.f_back
+        level += 1
+    return level
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldMeta:
+    """Column metadata derived from a single entity field annotation."""
+
+    name: str
+    field_type: Any
+    nonnull_type: Any
+    nullable: bool
+    # None if the annotation has no column type mapping
+    sa_type: Any
+
+
+# column fields per entity class. keys are weak, so entity classes that go away
+# (e.g. ones defined inside functions) don't stay alive through the cache
+_ENTITY_FIELDS: "WeakKeyDictionary[type, tuple[_FieldMeta, ...]]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=1024)
+def _analyze_field_type(field_type: Any) -> tuple[Any, Any, bool] | None:
+    """Analyzes (and caches) a field annotation for column generation.
+
+    Returns:
+        A `(nonnull_type, sa_type, is_nullable)` triple, or None if the annotation does not
+        map to a column. `sa_type` is None for types without a column type mapping.
+
+    Raises:
+        TypeError: If the annotation is an unsupported union type
+    """
+    # unresolved string annotations for the builtin scalars, e.g. from postponed evaluation
+    if type(field_type) is str and field_type in _TYPE_BY_NAME:
+        field_type = _TYPE_BY_NAME[field_type]
+
+    # fast path for plain scalar annotations, which are the vast majority of fields
+    if field_type in _TYPE_MAP:
+        return field_type, _TYPE_MAP[field_type], False
+
+    origin = get_origin(field_type)
+    # these are likely relationships
+    # TODO: maybe add support for dict as JSONB/JSON col types later
+    if origin in _SKIP_ORIGINS:
+        return None
+
+    if field_type is _NONE_TYPE:  # Direct None type annotation
+        return None
+
+    if origin is not Union and type(field_type) is not UnionType:
+        return field_type, _TYPE_MAP.get(field_type), False
+
+    # This is a Union type (including Optional which is Union[T, None])
+    args = field_type.__args__
+
+    # Union without None - completely unsupported
+    if _NONE_TYPE not in args:
+        raise TypeError(
+            f"unsupported union type: {field_type}. "
+            f"Union types are not supported in ORMs. "
+            f"Database columns must have a single type. "
+            f"If the field is optional, use Optional[T] or T | None."
+        )
+
+    # Remove None to get the actual type(s)
+    non_none_args = tuple(arg for arg in args if arg is not _NONE_TYPE)
+
+    # If there's more than one non-None type, it's still an invalid union
+    if len(non_none_args) > 1:
+        raise TypeError(
+            f"unsupported union type: {field_type}. "
+            f"Union types (other than Optional[T]) are not supported in ORMs. "
+            f"Database columns must have a single type. "
+            f"Use Optional[T] for nullable columns, not Union[T, U, ...]."
+        )
+
+    # Valid Optional type
+    nonnull_type = non_none_args[0]
+    return nonnull_type, _TYPE_MAP.get(nonnull_type), True
+
+
+def _entity_fields(entity_type: type[Any]) -> tuple[_FieldMeta, ...]:
+    """Introspects (and caches) the column fields of an entity class.
+
+    Private attributes, collection-typed fields and navigation properties to other entities
+    are skipped, and union annotations are validated here, so a context build only has to
+    apply per-configuration overrides.
+    `get_type_hints` evaluates every annotation and walks the MRO, so the fields are
+    cached per class to avoid paying that cost each time a context is built.
+    """
+    cached = _ENTITY_FIELDS.get(entity_type)
+    if cached is not None:
+        return cached
+
+    try:
+        type_hints = get_type_hints(entity_type)
+        resolved = True
+    except Exception:
+        # fallback to __annotations__ if get_type_hints fails, e.g. for a forward reference
+        # to a class that isn't defined yet. this isn't cached, so a later build can resolve it
+        type_hints = dict(getattr(entity_type, "__annotations__", {}))
+        resolved = False
+
+    # skip private attributes and special attributes up front
+    public_hints = [(name, hint) for name, hint in type_hints.items() if name[:1] != "_"]
+
+    fields: list[_FieldMeta] = []
+    for field_name, field_type in public_hints:
+        try:
+            analyzed = _analyze_field_type(field_type)
+        except TypeError as e:
+            raise TypeError(f"Entity {entity_type.__name__} field '{field_name}' has {e}") from None
+        if analyzed is None:
+            continue
+
+        nonnull_type, sa_type, is_nullable = analyzed
+        # navigation properties (other entities) are mapped by relationships, not columns
+        if getattr(nonnull_type, "__effigy_entity__", False):
+            continue
+        fields.append(_FieldMeta(field_name, field_type, nonnull_type, is_nullable, sa_type))
+
+    result = tuple(fields)
+    if resolved:
+        _ENTITY_FIELDS[entity_type] = result
+    return result
+
+
+@lru_cache(maxsize=1024)
+def _is_autoincrement_type(field_type: Any) -> bool:
+    """Checks whether a field type can hold database-generated values (i.e. int | None)."""
+    origin = get_origin(field_type)
+    if origin is Union or origin is UnionType:
+        args = get_args(field_type)
+        # need to type autoincrementing primary keys as int | None
+        return _NONE_TYPE in args and int in args
+    return False
+
 
 class DbBuilder:
     """Fluent API for configuring effigy entities"""
 
+    __slots__ = ("_metadata", "_registry", "_entity_configs")
+
     def __init__(self, metadata: MetaData):
         self._metadata = metadata
+        # shared by every entity mapped during this build, created on first use
+        self._registry: registry | None = None
         self._entity_configs: dict[Type[Any], _EntityConfiguration[Any]] = {}
 
     def entity(self, entity_type: Type[T]) -> "_EntityConfiguration[T]":
-        if entity_type not in self._entity_configs:
-            self._entity_configs[entity_type] = _EntityConfiguration(entity_type, self)
-        return self._entity_configs[entity_type]
+        config = self._entity_configs.get(entity_type)
+        if config is None:
+            config = self._entity_configs[entity_type] = _EntityConfiguration(entity_type, self)
+        return config
+
+    def _get_registry(self) -> registry:
+        if self._registry is None:
+            self._registry = registry(metadata=self._metadata)
+        return self._registry
 
     def _finalize(self) -> None:
-        for config in self._entity_configs.values():
+        configs = list(self._entity_configs.values())
+        # indexes are created alongside each table; relationships need every table to exist
+        for config in configs:
             config._create_table(self._metadata)
-        for config in self._entity_configs.values():
-            config._create_indexes()
-        for config in self._entity_configs.values():
+        for config in configs:
             config._create_relationships()
 
 
 class _EntityConfiguration(Generic[T]):
 
+    __slots__ = (
+        "_entity_type",
+        "_builder",
+        "_table_name",
+        "_proxy",
+        "_pks",
+        "_properties",
+        "_relationships",
+        "_indexes",
+    )
+
     def __init__(self, entity_type: type[T], builder: DbBuilder):
         self._entity_type = entity_type
         self._builder = builder
+        self._table_name: str | None = getattr(entity_type, "__tablename__", None)
+        # navigation proxies are stateless, so a single one is shared by all fluent calls
+        self._proxy = cast(T, _get_entity_proxy(entity_type))
         self._pks: list[str] = []
         self._properties: dict[str, PropertyConfiguration[T]] = {}
         self._relationships: list[RelationshipConfiguration[T]] = []
         self._indexes: list[IndexConfiguration] = []
 
     def property(self, navigation: Callable[[T], Any]) -> PropertyConfiguration[T]:
-        proxy = _EntityProxy(self._entity_type)
-        navattr = navigation(cast(T, proxy))
-        prop_name = navattr.key
-
-        if prop_name not in self._properties:
-            self._properties[prop_name] = PropertyConfiguration(prop_name, self._entity_type, self)
-
-        return self._properties[prop_name]
+        navattr = navigation(self._proxy)
+        return self._get_property_config_by_keyname(navattr.key)
 
     def has_key(
         self, *navigations: Callable[[T], Any], autoincrement: bool = False
@@ -89,25 +267,27 @@ class _EntityConfiguration(Generic[T]):
         for navigation in navigations:
             keyname = self._get_keyname_from_navigation(navigation)
             propconfig = self._get_property_config_by_keyname(keyname)
-            self._pks.append(keyname)
+            if keyname not in self._pks:
+                self._pks.append(keyname)
             if autoincrement:
                 propconfig.autoincrement()
         return self
 
     def _get_keyname_from_navigation(self, navigation: Callable[[T], Any]) -> str:
-        proxy = _EntityProxy(self._entity_type)
-        keyattr = navigation(cast(T, proxy))
+        keyattr = navigation(self._proxy)
         return cast(str, keyattr.key)
 
     def _get_property_config_by_keyname(self, keyname: str) -> PropertyConfiguration[T]:
         # if keyname is in properties, return it - otherwise, create config
-        if keyname in self._properties:
-            return self._properties[keyname]
-        return self.property(lambda e: getattr(e, keyname))
+        # (keyname was already validated by the navigation proxy)
+        propconfig = self._properties.get(keyname)
+        if propconfig is None:
+            propconfig = PropertyConfiguration(keyname, self._entity_type, self)
+            self._properties[keyname] = propconfig
+        return propconfig
 
     def has_one(self, navigation: Callable[[T], Any]) -> RelationshipConfiguration[T]:
-        proxy = _EntityProxy(self._entity_type)
-        navattr = navigation(cast(T, proxy))
+        navattr = navigation(self._proxy)
         navname = navattr.key
 
         rel_config = RelationshipConfiguration(
@@ -129,8 +309,7 @@ class _EntityConfiguration(Generic[T]):
             RelationshipConfiguration for further configuration (with_many, with_foreign_key,
             backpopulates, cascade, etc.)
         """
-        proxy = _EntityProxy(self._entity_type)
-        navattr = navigation(cast(T, proxy))
+        navattr = navigation(self._proxy)
         navname = navattr.key
 
         rel_config = RelationshipConfiguration(
@@ -161,18 +340,11 @@ class _EntityConfiguration(Generic[T]):
         return self
 
     def _validate_autoincrement(
-        self, field_name: str, field_type: Type[Any], *, autoincrement: bool
+        self, field_name: str, field_type: Any, *, autoincrement: bool
     ) -> None:
-        if not autoincrement:
+        if not autoincrement or _is_autoincrement_type(field_type):
             return
 
-        origin = get_origin(field_type)
-        if origin is Union or origin is UnionType:
-            args = get_args(field_type)
-            # need to type autoincrementing primary keys as int | None
-            if type(None) in args and int in args:
-                return
-
         raise TypeError(
             f"Database-generated values require an optional type. "
             f"Autoincrementing field {field_name} must be defined as int | None"
@@ -182,108 +354,74 @@ class _EntityConfiguration(Generic[T]):
         """Creates a SQLAlchemy Table and attaches it to the entity class.
 
         This method:
-        1. Introspects the entity class annotations to discover fields
+        1. Looks up the (cached) column fields introspected from the entity annotations
         2. Creates SQLAlchemy Column objects for each field
-        3. Builds a Table object with the columns
+        3. Builds a Table object with the columns and its configured indexes
         4. Attaches the table to the entity class as __table__
         5. Uses imperative mapping to register the entity with SQLAlchemy
         """
 
         # this should definitely be set already...
-        table_name = getattr(self._entity_type, "__tablename__")
+        table_name = self._table_name
         if not table_name:
             raise ValueError(f"Entity {self._entity_type.__name__} has no table name configured")
 
-        try:
-            type_hints = get_type_hints(self._entity_type)
-        except Exception:
-            # fallback to __annotations__ if get_type_hints fails
-            type_hints = getattr(self._entity_type, "__annotations__", {})
-
         if not self._pks:
             raise ValueError(f"Table {table_name} must have at least one primary key")
 
+        pk_names = frozenset(self._pks)
+        has_pk = False
         columns = []
-        for field_name, field_type in type_hints.items():
-            # skip private attributes and special attributes
-            if field_name.startswith("_"):
-                continue
+        for field in _entity_fields(self._entity_type):
+            field_name = field.name
+            field_type = field.field_type
+            nonnull_type = field.nonnull_type
+            is_nullable = field.nullable
+            sa_type = field.sa_type
+            if sa_type is None:
+                sa_type = String
+                warnings.warn(
+                    f"No column type mapping for {self._entity_type.__name__}.{field_name} "
+                    f"annotation {nonnull_type!r}, defaulting to String",
+                    stacklevel=_external_stacklevel(),
+                )
+
+            is_primary = field_name in pk_names
+            has_pk = has_pk or is_primary
 
-            origin = get_origin(field_type)
-            # these are likely relationships
-            # TODO: maybe add support for dict as JSONB/JSON col types later
-            if origin in (list, dict, set):
+            # additional configuration from property config (if present)
+            prop_config = self._properties.get(field_name)
+            if prop_config is None:
+                # default configuration values (assumed), so only the non-default kwargs are passed
+                columns.append(
+                    Column(
+                        field_name,
+                        sa_type,
+                        primary_key=is_primary,
+                        nullable=is_nullable and not is_primary,
+                    )
+                )
                 continue
 
-            # Check for optionality and validate union types
-            is_nullable = False
-            nonnull_type = field_type
+            required, autoincrement, max_length, unique, default, server_default = (
+                prop_config._required,
+                prop_config._autoincrement,
+                prop_config._max_length,
+                prop_config._unique,
+                prop_config._default,
+                prop_config._server_default,
+            )
+            nullable = is_nullable and not required
 
-            origin = get_origin(field_type)
-            if origin is type(None):  # Direct None type annotation
-                continue
-            elif origin is Union or (
-                hasattr(field_type, "__args__") and len(getattr(field_type, "__args__", ())) > 1
-            ):
-                # This is a Union type (including Optional which is Union[T, None])
-                args = getattr(field_type, "__args__", ())
-
-                # Check if None is in the union (making it Optional)
-                if type(None) in args:
-                    # Remove None to get the actual type(s)
-                    non_none_args = [arg for arg in args if arg is not type(None)]
-
-                    # If there's more than one non-None type, it's still an invalid union
-                    if len(non_none_args) > 1:
-                        raise TypeError(
-                            f"Entity {self._entity_type.__name__} field '{field_name}' has unsupported union type: {field_type}. "
-                            f"Union types (other than Optional[T]) are not supported in ORMs. "
-                            f"Database columns must have a single type. "
-                            f"Use Optional[T] for nullable columns, not Union[T, U, ...]."
-                        )
-
-                    # Valid Optional type
-                    is_nullable = True
-                    nonnull_type = non_none_args[0] if non_none_args else field_type
-                else:
-                    # Union without None - completely unsupported
-                    raise TypeError(
-                        f"Entity {self._entity_type.__name__} field '{field_name}' has unsupported union type: {field_type}. "
-                        f"Union types are not supported in ORMs. "
-                        f"Database columns must have a single type. "
-                        f"If the field is optional, use Optional[T] or T | None."
+            # apply max_length to string-type cols
+            if max_length is not None:
+                # max_length should only be used on string-type cols
+                if nonnull_type != str:
+                    raise ValueError(
+                        f"Entity {self._entity_type.__name__} field '{field_name}': "
+                        f"max_len() can only be used on string (str) fields, not {nonnull_type.__name__}"
                     )
-
-            # default to string if we can't deduce what the type is
-            sa_type = _TYPE_MAP.get(nonnull_type, String)
-
-            is_primary = field_name in self._pks
-
-            # additional configuration from property config (if present)
-            prop_config = self._properties.get(field_name)
-            if prop_config:
-                nullable = is_nullable and not prop_config._required
-                unique = prop_config.is_unique
-                default = prop_config.default
-                autoincrement = prop_config.is_autoincrement
-                server_default = prop_config.server_default
-
-                # apply max_length to string-type cols
-                if prop_config._max_length is not None:
-                    # max_length should only be used on string-type cols
-                    if nonnull_type != str:
-                        raise ValueError(
-                            f"Entity {self._entity_type.__name__} field '{field_name}': "
-                            f"max_len() can only be used on string (str) fields, not {nonnull_type.__name__}"
-                        )
-                    sa_type = String(prop_config._max_length)
-            else:
-                # default configuration values (assumed)
-                nullable = is_nullable and not is_primary
-                unique = False
-                default = None
-                autoincrement = False
-                server_default = None
+                sa_type = String(max_length)
 
             self._validate_autoincrement(field_name, field_type, autoincrement=autoincrement)
             col = Column(
@@ -298,40 +436,46 @@ class _EntityConfiguration(Generic[T]):
             )
             columns.append(col)
 
+        # keys can be configured on attributes that don't map to columns (e.g. collections)
+        if not has_pk:
+            raise ValueError(
+                f"Table {table_name} must have at least one primary key column. "
+                f"Configured keys: {', '.join(self._pks)}"
+            )
+
         table = Table(table_name, metadata, *columns)
+        self._create_indexes(table, table_name)
 
         setattr(self._entity_type, "__table__", table)
 
         # Use imperative mapping to register the entity with SQLAlchemy's ORM
         # This enables queries, change tracking, relationships, and all ORM features
         # Only map if not already mapped (to support multiple context instances)
-        if not hasattr(self._entity_type, "__mapper__"):
-            mapper_reg = registry()
-            mapper_reg.map_imperatively(self._entity_type, table)
+        if getattr(self._entity_type, "__mapper__", None) is None:
+            self._builder._get_registry().map_imperatively(self._entity_type, table)
 
-    def _create_indexes(self) -> None:
+    def _create_indexes(self, table: Table, table_name: str) -> None:
         """Creates SQLAlchemy Index objects for all configured indexes.
 
         This method applies all configured indexes by calling create_index() on each
-        IndexConfiguration. The indexes are created on the table that was previously
-        created by _create_table().
-        """
-        table = getattr(self._entity_type, "__table__", None)
-        if table is None:
-            raise ValueError(f"Entity {self._entity_type.__name__} has no table configured")
+        IndexConfiguration. It is invoked by _create_table() as soon as the entity's
+        table exists, since indexes never depend on other entities.
 
-        table_name = getattr(self._entity_type, "__tablename__")
+        Args:
+            table: The table the indexes are created on
+            table_name: The name of the table, used to generate index names
+        """
         for index_config in self._indexes:
             index_config.create_index(table, table_name)
 
     def _create_relationships(self) -> None:
-        """Creates SQLAlchemy relationship() objects and attaches them to entity classes.
+        """Creates SQLAlchemy relationship() objects and maps them on the entity classes.
 
         This method applies all configured relationships by calling _apply() on each
         RelationshipConfiguration. The _apply() method:
         1. Creates a SQLAlchemy relationship() with configured options (cascade, lazy, etc.)
-        2. Attaches the relationship to the entity class as a dynamic attribute
-        3. Handles foreign key references if specified
+        2. Declares the foreign key constraint, or the association table for many-to-many
+        3. Adds the relationship to the entity's mapper
         4. Sets up bidirectional relationships via back_populates if configured
         """
         for rel_config in self._relationships:
@@ -343,7 +487,7 @@ class _EntityConfiguration(Generic[T]):
 
         This checks:
         1. That the related entity is also configured in the builder
-        2. For non-M:M relationships, that the foreign key column exists
+        2. For non-M:M relationships, that a foreign key is configured and its column exists
 
         Args:
             rel_config: The relationship configuration to validate
@@ -351,11 +495,7 @@ class _EntityConfiguration(Generic[T]):
         Raises:
             ValueError: If validation fails
         """
-        # determine the related entity if not already set
-        if not rel_config._related_entity:
-            rel_config._related_entity = rel_config._determine_related_entity()
-
-        related_entity = rel_config._related_entity
+        related_entity = rel_config.related_entity
 
         # validate that the related entity is configured in the builder
         if related_entity not in self._builder._entity_configs:
@@ -367,25 +507,32 @@ class _EntityConfiguration(Generic[T]):
             )
 
         if rel_config._relationship_type != RelationshipType.MANY_TO_MANY:
-            if rel_config._fk_prop:
-                # determine which entity owns the FK
-                if rel_config._relationship_type == RelationshipType.ONE_TO_MANY:
-                    fk_owner = related_entity
-                else:
-                    fk_owner = self._entity_type
-
-                fk_table = getattr(fk_owner, "__table__", None)
-                if fk_table is None:
-                    raise ValueError(
-                        f"Cannot validate foreign key for relationship "
-                        f"'{rel_config._navigation_name}'. The entity "
-                        f"{fk_owner.__name__} has no table configured."
-                    )
-
-                if rel_config._fk_prop not in fk_table.columns:
-                    raise ValueError(
-                        f"Cannot create relationship '{rel_config._navigation_name}' on "
-                        f"{self._entity_type.__name__}. The foreign key column "
-                        f"'{rel_config._fk_prop}' does not exist on {fk_owner.__name__}. "
-                        f"Available columns: {', '.join(fk_table.columns.keys())}"
-                    )
+            # the join condition is built from the configured foreign key column
+            if not rel_config._fk_prop:
+                raise ValueError(
+                    f"Cannot create relationship '{rel_config._navigation_name}' on "
+                    f"{self._entity_type.__name__}. No foreign key is configured; "
+                    f"specify it with with_foreign_key()."
+                )
+
+            # determine which entity owns the FK
+            if rel_config._relationship_type == RelationshipType.ONE_TO_MANY:
+                fk_owner = related_entity
+            else:
+                fk_owner = self._entity_type
+
+            fk_table = fk_owner.__dict__.get("__table__")
+            if fk_table is None:
+                raise ValueError(
+                    f"Cannot validate foreign key for relationship "
+                    f"'{rel_config._navigation_name}'. The entity "
+                    f"{fk_owner.__name__} has no table configured."
+                )
+
+            if rel_config._fk_prop not in fk_table.columns:
+                raise ValueError(
+                    f"Cannot create relationship '{rel_config._navigation_name}' on "
+                    f"{self._entity_type.__name__}. The foreign key column "
+                    f"'{rel_config._fk_prop}' does not exist on {fk_owner.__name__}. "
+                    f"Available columns: {', '.join(fk_table.columns.keys())}"
+                )
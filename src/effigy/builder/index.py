@@ -2,18 +2,17 @@ from sqlalchemy import Index, Table
 
 
 class IndexConfiguration:
+    __slots__ = ("_columns", "_unique", "_name", "_prefix", "_col_suffix")
+
     def __init__(self, columns: list[str], unique: bool, *, name: str | None = None):
         self._columns = columns
         self._unique = unique
         self._name = name
+        # the generated name only varies by table, so precompute the rest of it
+        self._prefix = "uq" if unique else "ix"
+        self._col_suffix = "_".join(columns)
 
     def create_index(self, table: Table, table_name: str) -> Index:
-        index_cols = [table.c[col_name] for col_name in self._columns]
-
-        if self._name:
-            index_name = self._name
-        else:
-            prefix = "uq" if self._unique else "ix"
-            col_names = "_".join(self._columns)
-            index_name = f"{prefix}_{table_name}_{col_names}"
+        index_cols = list(map(table.c.__getitem__, self._columns))
+        index_name = self._name or f"{self._prefix}_{table_name}_{self._col_suffix}"
         return Index(index_name, *index_cols, unique=self._unique)
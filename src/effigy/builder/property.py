@@ -10,6 +10,18 @@ T = TypeVar("T")
 
 
 class PropertyConfiguration(Generic[T]):
+    __slots__ = (
+        "_property_name",
+        "_entity_type",
+        "_entity_configuration",
+        "_required",
+        "_autoincrement",
+        "_max_length",
+        "_default",
+        "_server_default",
+        "_unique",
+    )
+
     def __init__(
         self,
         property_name: str,
@@ -1,11 +1,13 @@
-from typing import Any, Callable, TypeVar, Generic, Type, TYPE_CHECKING, cast
+import sys
+from typing import Any, Callable, ForwardRef, TypeVar, Generic, Type, TYPE_CHECKING, cast, get_args
 from typing_extensions import Self
 from enum import Enum
 
-from sqlalchemy import Table, Column, ForeignKey, MetaData
-from sqlalchemy.orm import relationship
+from sqlalchemy import Table, Column, ForeignKey, ForeignKeyConstraint, MetaData
+from sqlalchemy.orm import class_mapper, joinedload, relationship, selectinload
+from sqlalchemy.orm.strategy_options import Load
 
-from ..entity import _EntityProxy
+from ..entity import _add_reference, _get_entity_proxy
 
 if TYPE_CHECKING:
     from .core import _EntityConfiguration
@@ -20,7 +22,46 @@ class RelationshipType(str, Enum):
     MANY_TO_MANY = "mtm"
 
 
+_NONE_TYPE = type(None)
+
+# relationship types by value, so configuration strings skip the Enum call machinery
+_RT_MAP: dict[str, RelationshipType] = {rt.value: rt for rt in RelationshipType}
+
+# forward references resolved so far, keyed by (module name, class name)
+_FORWARD_REFS: dict[tuple[str, str], type[Any]] = {}
+
+
+def _resolve_forward_ref(module_name: str, name: str) -> type[Any] | None:
+    """Resolves a forward reference string against the module that declared it.
+
+    Only successful lookups are cached, so a reference to a class that isn't defined
+    yet can still resolve on a later attempt.
+    """
+    key = (module_name, name)
+    resolved = _FORWARD_REFS.get(key)
+    if resolved is None:
+        module = sys.modules.get(module_name)
+        resolved = getattr(module, name, None) if module else None
+        if resolved is not None:
+            _FORWARD_REFS[key] = resolved
+    return resolved
+
+
 class RelationshipConfiguration(Generic[T]):
+    __slots__ = (
+        "_navigation_name",
+        "_relationship_type",
+        "_entity_type",
+        "_entity_config",
+        "_fk_prop",
+        "_fk_col",
+        "_inverse_prop",
+        "_related_entity",
+        "_rel_kwargs",
+        "_applied",
+        "_loader_option",
+    )
+
     def __init__(
         self,
         navigation_name: str,
@@ -32,7 +73,8 @@ class RelationshipConfiguration(Generic[T]):
         self._relationship_type = (
             relationship_type
             if isinstance(relationship_type, RelationshipType)
-            else RelationshipType(relationship_type)
+            # unknown values fall through to the Enum, which raises the usual ValueError
+            else _RT_MAP.get(relationship_type) or RelationshipType(relationship_type)
         )
         self._entity_type = entity_type
         self._entity_config = entity_config
@@ -41,11 +83,22 @@ class RelationshipConfiguration(Generic[T]):
         self._fk_col: str | None = None
 
         self._inverse_prop: str | None = None
-        self._related_entity: type[object] | None = None
-
-        self._cascade: str = "save-update, merge"
-        self._lazy: str = "select"
-        self._back_populates: str | None = None
+        self._related_entity: type[Any] | None = None
+
+        # keyword arguments for relationship(), kept current by the configuration methods.
+        # related rows are eager loaded by default to avoid N+1 selects: a single joined
+        # row for many-to-one, one batched IN query per relationship for collections
+        lazy = "joined" if self._relationship_type == RelationshipType.MANY_TO_ONE else "selectin"
+        self._rel_kwargs: dict[str, Any] = {"cascade": "save-update, merge", "lazy": lazy}
+        self._applied = False
+        self._loader_option: Load | None = None
+
+    @property
+    def related_entity(self) -> type[Any]:
+        """The related entity type, determined from the navigation annotation on first access."""
+        if self._related_entity is None:
+            self._related_entity = self._determine_related_entity()
+        return self._related_entity
 
     def with_foreign_key(self, navigation: Callable[[Any], Any]) -> Self:
         """Specifies the foreign key column for the relationship.
@@ -67,58 +120,15 @@ class RelationshipConfiguration(Generic[T]):
                 "Many-to-many relationships use auto-generated association tables."
             )
 
-        if not hasattr(self._entity_type, "__annotations__"):
-            raise ValueError(
-                f"Entity {self._entity_type.__name__} has no type annotations. "
-                f"Cannot configure relationship for '{self._navigation_name}'."
-            )
-
-        entity_annotations = self._entity_type.__annotations__
-        navtype = entity_annotations.get(self._navigation_name)
-
-        if navtype is None:
-            raise ValueError(
-                f"Navigation property '{self._navigation_name}' not found on entity "
-                f"{self._entity_type.__name__}. Available properties: "
-                f"{', '.join(entity_annotations.keys())}"
-            )
-
-        if hasattr(navtype, "__args__"):
-            related = navtype.__args__[0]
-
-            # handle forward reference strings
-            if isinstance(related, str):
-                import sys
-
-                entity_module = sys.modules.get(self._entity_type.__module__)
-                self._related_entity = (
-                    getattr(entity_module, related, None) if entity_module else None
-                )
-
-                # fail fast if forward reference can't be resolved
-                if self._related_entity is None:
-                    raise ValueError(
-                        f"Cannot resolve forward reference '{related}' for relationship "
-                        f"'{self._navigation_name}' on entity {self._entity_type.__name__}. "
-                        f"Ensure the referenced entity '{related}' is defined at module level "
-                        f"in {self._entity_type.__module__}."
-                    )
-            else:
-                self._related_entity = related
-        else:
-            self._related_entity = navtype
-
         if self._relationship_type == RelationshipType.ONE_TO_MANY:
             # FK is on the related entity (the "many" side)
-            fk_owner = self._related_entity
+            proxy = self._get_related_proxy()
         else:
-            # FK is on the current entity (the "many" side)
-            fk_owner = self._entity_type
+            # FK is on the current entity (the "many" side), whose configuration holds its proxy
+            proxy = self._entity_config._proxy
 
-        if fk_owner:
-            proxy = _EntityProxy(fk_owner)
-            fkattr = navigation(proxy)
-            self._fk_prop = fkattr.key
+        fkattr = navigation(proxy)
+        self._fk_prop = fkattr.key
 
         return self
 
@@ -150,12 +160,9 @@ class RelationshipConfiguration(Generic[T]):
 
         # set up bidirectional relationship if navigation provided
         if navigation:
-            if not self._related_entity:
-                self._related_entity = self._determine_related_entity()
-            proxy = _EntityProxy(self._related_entity)
-            backpop = navigation(proxy)
+            backpop = navigation(self._get_related_proxy())
             self._inverse_prop = backpop.key
-            self._back_populates = backpop.key
+            self._rel_kwargs["back_populates"] = backpop.key
 
         return self
 
@@ -168,22 +175,70 @@ class RelationshipConfiguration(Generic[T]):
         Args:
             navigation: Lambda that navigates to the inverse property (e.g., lambda u: u.posts)
         """
-        if not self._related_entity:
-            self._related_entity = self._determine_related_entity()
-        proxy = _EntityProxy(self._related_entity)
-        backpop = navigation(proxy)
+        backpop = navigation(self._get_related_proxy())
         self._inverse_prop = backpop.key
-        self._back_populates = backpop.key
+        self._rel_kwargs["back_populates"] = backpop.key
         return self
 
     def cascade(self, cascade: str) -> Self:
-        self._cascade = cascade
+        """Sets the cascade behavior of the relationship.
+
+        Cascades that include "delete" also enable passive deletes, unless they were
+        configured explicitly with `with_passive_deletes()`.
+        """
+        self._rel_kwargs["cascade"] = cascade
+        if "delete" in cascade:
+            self._rel_kwargs.setdefault("passive_deletes", True)
+        return self
+
+    def with_passive_deletes(self, passive_deletes: bool = True) -> Self:
+        """Leaves deleting related rows to the database instead of loading them first.
+
+        This only removes the per-child SELECT and DELETE statements if the foreign key
+        is declared with `ON DELETE CASCADE` in the database schema.
+
+        Args:
+            passive_deletes: Whether or not to enable passive deletes. Defaults to True.
+        """
+        self._rel_kwargs["passive_deletes"] = passive_deletes
         return self
 
     def with_lazy_loading(self, lazy: str = "select") -> Self:
-        self._lazy = lazy
+        """Overrides the loader strategy for the relationship.
+
+        Args:
+            lazy: Any SQLAlchemy `lazy` value, e.g. "select" to load on first access or
+                "raise" to catch unintended loads. Defaults to "select".
+        """
+        self._rel_kwargs["lazy"] = lazy
         return self
 
+    def loader_option(self) -> Load:
+        """Builds an eager loading option for the relationship, for use in `select(...).options()`.
+
+        Many-to-one relationships load through a join, and collections through a batched
+        IN query, matching the default loader strategies.
+
+        Raises:
+            RuntimeError: If the relationship has not been applied yet
+        """
+        if not self._applied:
+            raise RuntimeError(
+                f"Relationship '{self._navigation_name}' on entity {self._entity_type.__name__} "
+                f"has not been applied yet. Loader options are available once the context is built."
+            )
+        if self._loader_option is None:
+            navigation = getattr(self._entity_type, self._navigation_name)
+            if self._relationship_type == RelationshipType.MANY_TO_ONE:
+                self._loader_option = cast(Load, joinedload(navigation))
+            else:
+                self._loader_option = cast(Load, selectinload(navigation))
+        return self._loader_option
+
+    def _get_related_proxy(self) -> Any:
+        """Gets the navigation proxy for the related entity."""
+        return _get_entity_proxy(self.related_entity)
+
     def _determine_related_entity(self) -> Type[Any]:
         """Determines the related entity type from the navigation property annotation.
 
@@ -212,30 +267,26 @@ class RelationshipConfiguration(Generic[T]):
                 f"{', '.join(entity_annotations.keys())}"
             )
 
-        # extract the type from list[T] or similar generic types
-        if hasattr(navtype, "__args__"):
-            related = navtype.__args__[0]
-
-            # handle forward reference strings
-            if isinstance(related, str):
-                import sys
-
-                entity_module = sys.modules.get(self._entity_type.__module__)
-                related_entity = getattr(entity_module, related, None) if entity_module else None
-
-                # fail fast if forward reference can't be resolved
-                if related_entity is None:
-                    raise ValueError(
-                        f"Cannot resolve forward reference '{related}' for relationship "
-                        f"'{self._navigation_name}' on entity {self._entity_type.__name__}. "
-                        f"Ensure the referenced entity '{related}' is defined at module level "
-                        f"in {self._entity_type.__module__}."
-                    )
-                return cast(Type[Any], related_entity)
-            else:
-                return cast(Type[Any], related)
-        else:
-            return navtype
+        # extract the type from list[T], T | None or similar generic types
+        args = [arg for arg in get_args(navtype) if arg is not _NONE_TYPE]
+        related = args[0] if args else navtype
+
+        # handle forward references, e.g. list["Post"] or Optional["User"]
+        if isinstance(related, ForwardRef):
+            related = related.__forward_arg__
+        if isinstance(related, str):
+            related_entity = _resolve_forward_ref(self._entity_type.__module__, related)
+
+            # fail fast if forward reference can't be resolved
+            if related_entity is None:
+                raise ValueError(
+                    f"Cannot resolve forward reference '{related}' for relationship "
+                    f"'{self._navigation_name}' on entity {self._entity_type.__name__}. "
+                    f"Ensure the referenced entity '{related}' is defined at module level "
+                    f"in {self._entity_type.__module__}."
+                )
+            return related_entity
+        return cast(type[Any], related)
 
     def _create_association_table(self, metadata: MetaData) -> Table:
         """Creates an association table for many-to-many relationships.
@@ -252,46 +303,46 @@ class RelationshipConfiguration(Generic[T]):
         Returns:
             The created or existing association Table
         """
-        if not self._related_entity:
-            self._related_entity = self._determine_related_entity()
+        # __table__ is always set on the entity class itself, so skip the MRO walk;
+        # a table's name is the entity's __tablename__
+        current_table = self._entity_type.__dict__["__table__"]
+        related_table = self.related_entity.__dict__["__table__"]
 
-        current_table_name = getattr(self._entity_type, "__tablename__")
-        related_table_name = getattr(self._related_entity, "__tablename__")
+        current_table_name = current_table.name
+        related_table_name = related_table.name
 
-        table_names = sorted([current_table_name, related_table_name])
-        association_table_name = f"{table_names[0]}_{table_names[1]}"
+        first_name, second_name = sorted((current_table_name, related_table_name))
+        association_table_name = f"{first_name}_{second_name}"
 
         if association_table_name in metadata.tables:
             return metadata.tables[association_table_name]
 
-        current_table = getattr(self._entity_type, "__table__")
-        related_table = getattr(self._related_entity, "__table__")
+        # the primary key constraint already tracks its columns, so no column scan is needed
+        current_pk = next(iter(current_table.primary_key.columns), None)
+        related_pk = next(iter(related_table.primary_key.columns), None)
 
-        current_pk_cols = [col for col in current_table.columns if col.primary_key]
-        related_pk_cols = [col for col in related_table.columns if col.primary_key]
-
-        if not current_pk_cols or not related_pk_cols:
+        if current_pk is None or related_pk is None:
             raise ValueError(
                 f"Cannot create association table for many-to-many relationship. "
                 f"Both entities must have primary keys defined."
             )
 
-        current_fk_name = f"{current_table_name}_{current_pk_cols[0].name}"
-        related_fk_name = f"{related_table_name}_{related_pk_cols[0].name}"
+        current_fk_name = f"{current_table_name}_{current_pk.name}"
+        related_fk_name = f"{related_table_name}_{related_pk.name}"
 
         association_table = Table(
             association_table_name,
             metadata,
             Column(
                 current_fk_name,
-                current_pk_cols[0].type,
-                ForeignKey(f"{current_table_name}.{current_pk_cols[0].name}"),
+                current_pk.type,
+                ForeignKey(f"{current_table_name}.{current_pk.name}"),
                 primary_key=True,
             ),
             Column(
                 related_fk_name,
-                related_pk_cols[0].type,
-                ForeignKey(f"{related_table_name}.{related_pk_cols[0].name}"),
+                related_pk.type,
+                ForeignKey(f"{related_table_name}.{related_pk.name}"),
                 primary_key=True,
             ),
         )
@@ -299,32 +350,94 @@ class RelationshipConfiguration(Generic[T]):
         return association_table
 
     def _apply(self) -> None:
-        """Applies the relationship configuration by creating a SQLAlchemy relationship.
+        """Applies the relationship configuration by mapping a SQLAlchemy relationship.
 
         For MANY_TO_MANY relationships, this creates an association table and uses
-        the 'secondary' parameter. For other relationships, it uses foreign_keys.
+        the 'secondary' parameter. For other relationships, it declares the foreign key
+        constraint on the FK column. Join conditions are given explicitly in terms of the
+        mapped class attributes, so they hold for the tables an entity was first mapped to.
+
+        Applying is idempotent; repeated calls on the same configuration are no-ops.
         """
-        rel_kwargs: dict[str, Any] = {"cascade": self._cascade, "lazy": self._lazy}
+        if self._applied:
+            return
 
-        if self._back_populates:
-            rel_kwargs["back_populates"] = self._back_populates
+        rel_kwargs = dict(self._rel_kwargs)
+        entity_type = self._entity_type
+        related_entity = self.related_entity
+        current_table = entity_type.__dict__["__table__"]
+        related_table = related_entity.__dict__["__table__"]
 
         # handle many-to-many relationships (create association tables)
         if self._relationship_type == RelationshipType.MANY_TO_MANY:
-            if not self._related_entity:
-                self._related_entity = self._determine_related_entity()
+            association_table = self._create_association_table(current_table.metadata)
+            current_pk = _primary_key_name(current_table)
+            related_pk = _primary_key_name(related_table)
+            current_fk = association_table.c[f"{current_table.name}_{current_pk}"]
+            related_fk = association_table.c[f"{related_table.name}_{related_pk}"]
 
-            current_table = getattr(self._entity_type, "__table__")
-            metadata = current_table.metadata
-
-            association_table = self._create_association_table(metadata)
             rel_kwargs["secondary"] = association_table
+            rel_kwargs["primaryjoin"] = lambda: getattr(entity_type, current_pk) == current_fk
+            rel_kwargs["secondaryjoin"] = lambda: getattr(related_entity, related_pk) == related_fk
+
+        elif self._fk_prop:
+            # the FK is on the "many" side, and references the primary key of the "one" side
+            if self._relationship_type == RelationshipType.ONE_TO_MANY:
+                parent, child, parent_table, child_table = (
+                    entity_type, related_entity, current_table, related_table
+                )
+            else:
+                parent, child, parent_table, child_table = (
+                    related_entity, entity_type, related_table, current_table
+                )
+            parent_pk = _primary_key_name(parent_table)
+            fk_prop = self._fk_prop
+
+            # passive deletes rely on the database deleting the children of a deleted parent
+            ondelete = (
+                "CASCADE"
+                if self._relationship_type == RelationshipType.ONE_TO_MANY
+                and rel_kwargs.get("passive_deletes")
+                else None
+            )
+            _add_foreign_key(child_table.c[fk_prop], parent_table.c[parent_pk], ondelete)
 
-        elif self._fk_prop and self._related_entity:
-            # get the actual column reference from the related entity
-            fk_attr = getattr(self._related_entity, self._fk_prop, None)
-            if fk_attr is not None:
-                rel_kwargs["foreign_keys"] = [fk_attr]
-
-        rel = relationship(self._related_entity, **rel_kwargs)
-        setattr(self._entity_type, self._navigation_name, rel)
+            rel_kwargs["primaryjoin"] = lambda: (
+                getattr(parent, parent_pk) == getattr(child, fk_prop)
+            )
+            rel_kwargs["foreign_keys"] = lambda: [getattr(child, fk_prop)]
+
+        # entities are only mapped by the first context that configures them (see
+        # _EntityConfiguration._create_table), so their relationships are mapped along with them
+        mapper = class_mapper(entity_type, configure=False)
+        if not mapper.has_property(self._navigation_name):
+            mapper.add_property(self._navigation_name, relationship(related_entity, **rel_kwargs))
+            if self._relationship_type == RelationshipType.MANY_TO_ONE:
+                _add_reference(entity_type, self._navigation_name)
+        self._applied = True
+
+
+def _primary_key_name(table: Table) -> str:
+    """Gets the name of the single primary key column the related table's rows are referenced by."""
+    pk_columns = list(table.primary_key.columns)
+    if len(pk_columns) != 1:
+        raise ValueError(
+            f"Cannot create a relationship to table '{table.name}'. Related entities must have "
+            f"a single-column primary key."
+        )
+    return pk_columns[0].name
+
+
+def _add_foreign_key(column: Column[Any], target: Column[Any], ondelete: str | None) -> None:
+    """Declares a foreign key constraint from `column` to `target`, unless it already exists.
+
+    Both sides of a bidirectional relationship declare the same foreign key, so an existing
+    constraint is reused, and only gains the `ON DELETE` action if it didn't have one yet.
+    """
+    for foreign_key in column.foreign_keys:
+        if foreign_key.references(target.table):
+            constraint = foreign_key.constraint
+            if ondelete is not None and constraint is not None and constraint.ondelete is None:
+                foreign_key.ondelete = constraint.ondelete = ondelete
+            return
+    column.table.append_constraint(ForeignKeyConstraint([column], [target], ondelete=ondelete))
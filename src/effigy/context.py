@@ -1,8 +1,12 @@
+import inspect
+import threading
 from abc import ABC, abstractmethod
-from typing import get_origin, get_args, Any
+from collections.abc import Callable, Iterable, Mapping
+from typing import ClassVar, get_origin, get_args, Any
+from weakref import WeakKeyDictionary
 from typing_extensions import Self
 
-from sqlalchemy import MetaData, create_engine, Engine
+from sqlalchemy import MetaData, create_engine, Engine, insert
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
@@ -12,26 +16,139 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import sessionmaker, Session
 
 from .builder.core import DbBuilder
-from .dbset import AsyncDbSet, DbSet
+from .dbset import AsyncDbSet, DbSet, _mapped_table
 from .provider.base import DatabaseProvider
 
+# context classes whose schema has already been created, per (sync) engine
+_SCHEMA_CREATED: "WeakKeyDictionary[Engine, set[type]]" = WeakKeyDictionary()
+
+# engines shared by the contexts created from a provider, with the number of contexts using them
+_ENGINES: "WeakKeyDictionary[DatabaseProvider[Any], list[Any]]" = WeakKeyDictionary()
+# guards _ENGINES, so contexts created concurrently can't create two engines for a provider
+_ENGINES_LOCK = threading.Lock()
+
+
+def _acquire_engine(provider: DatabaseProvider[Any], create: Callable[..., Any]) -> Any:
+    """Gets the engine shared by contexts of a provider, creating it with `create` if needed.
+
+    Sharing the engine lets contexts reuse its connection pool instead of opening new
+    connections for every context.
+    """
+    with _ENGINES_LOCK:
+        entry = _ENGINES.get(provider)
+        if entry is None:
+            engine = create(provider.get_connection_string(), **provider.get_engine_options())
+            entry = _ENGINES[provider] = [engine, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_engine(provider: DatabaseProvider[Any]) -> Any | None:
+    """Releases a context's hold on its provider's engine.
+
+    Returns:
+        The engine once no context uses it anymore (and it should be disposed), otherwise None
+    """
+    with _ENGINES_LOCK:
+        entry = _ENGINES.get(provider)
+        if entry is None:
+            return None
+        entry[1] -= 1
+        if entry[1] > 0:
+            return None
+        del _ENGINES[provider]
+        return entry[0]
+
+
+class _DbContextBase(ABC):
+    """State and DbSet discovery shared by the synchronous and asynchronous contexts."""
+
+    __slots__ = (
+        "_provider",
+        "_engine",
+        "_session_factory",
+        "_session_cls",
+        "_session_kwargs",
+        "_session",
+        "_metadata",
+        "_pending_ops",
+    )
+
+    # the DbSet class whose annotations are bound to the context, set by each context type
+    _dbset_type: ClassVar[type[Any]]
+
+    # attribute name -> entity type for each DbSet annotation, collected per subclass
+    _dbset_specs: ClassVar[dict[str, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # DbSets declared on base contexts are inherited, and can be redeclared by subclasses
+        specs: dict[str, Any] = {}
+        for base in reversed(cls.__mro__[1:]):
+            specs.update(base.__dict__.get("_dbset_specs", {}))
+        for name, annotation in inspect.get_annotations(cls).items():
+            origin: Any = get_origin(annotation)
+            if origin is cls._dbset_type:
+                specs[name] = get_args(annotation)[0]
+        cls._dbset_specs = specs
+
+    def __getattr__(self, name: str) -> Any:
+        # DbSets are created on first access, so a context only builds the sets it uses
+        entity_type = self._dbset_specs.get(name)
+        if entity_type is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        dbset = self._dbset_type(entity_type, self)
+        setattr(self, name, dbset)
+        return dbset
 
-class DbContext(ABC):
+    @abstractmethod
+    def setup(self, builder: DbBuilder) -> None: ...
+
+    def _init_dbsets(self) -> MetaData:
+        metadata = MetaData()
+        builder = DbBuilder(metadata)
+
+        self.setup(builder)
+
+        builder._finalize()
+
+        return metadata
+
+    @staticmethod
+    def _pending_change_count(session: Session | AsyncSession) -> int:
+        """Counts the changes tracked by a session that have not been flushed yet."""
+        return len(session.dirty) + len(session.new) + len(session.deleted)
+
+
+class DbContext(_DbContextBase):
     """Synchronous database context"""
 
-    def __init__(self, provider: DatabaseProvider[Any]):
-        connection_string = provider.get_connection_string()
-        opts = provider.get_engine_options()
+    __slots__ = ()
+
+    _dbset_type = DbSet
 
-        self._engine: Engine = create_engine(connection_string, **opts)
+    def __init__(self, provider: DatabaseProvider[Any]):
+        self._provider: DatabaseProvider[Any] | None = provider
+        self._metadata = self._init_dbsets()
+        # the engine is only acquired once setup() succeeded, so a failing setup can't leak it
+        self._engine: Engine = _acquire_engine(provider, create_engine)
         self._session_factory = sessionmaker(bind=self._engine)
+        # sessions are constructed directly, skipping the factory's per-call kwargs merge
+        self._session_cls = self._session_factory.class_
+        self._session_kwargs = self._session_factory.kw
         self._session: Session | None = None
-        self._metadata = self._init_dbsets()
-
-        self._metadata.create_all(self._engine, checkfirst=True)
-
-    @abstractmethod
-    def setup(self, builder: DbBuilder) -> None: ...
+        # DbSet operations since the last commit, for batched save_changes calls
+        self._pending_ops = 0
+
+        # the schema only depends on the context class, so check it once per engine
+        created = _SCHEMA_CREATED.setdefault(self._engine, set())
+        if type(self) not in created:
+            try:
+                self._metadata.create_all(self._engine, checkfirst=True)
+            except Exception:
+                self.dispose()
+                raise
+            created.add(type(self))
 
     def _get_session(self) -> Session:
         """Internal method to get the session. Not part of public API."""
@@ -39,69 +156,115 @@ class DbContext(ABC):
             raise RuntimeError("Session not initialized. Use `with` statement.")
         return self._session
 
-    def _init_dbsets(self) -> MetaData:
-        metadata = MetaData()
-        builder = DbBuilder(metadata)
+    def save_changes(self, *, batch_size: int = 1) -> int:
+        """Attempts to persist changes to the database.
 
-        self.setup(builder)
+        Args:
+            batch_size: The number of DbSet operations (adds, removes, ...) that must be pending
+                before changes are committed. Larger batches let save_changes() be called once per
+                entity while still committing in groups; anything deferred is committed by a later
+                call or when the context exits. Defaults to 1, which always commits.
 
-        builder._finalize()
+        Returns:
+            The total number of tracked changes in this operation, or 0 if the commit was deferred
+
+        Raises:
+            SQLAlchemyError: If the commit fails. The session is rolled back before any error
+                raised while committing is re-raised unchanged
+        """
+        session = self._get_session()
+        if batch_size > 1 and self._pending_ops < batch_size:
+            return 0
+        try:
+            # count pending changes before commit flushes and clears them
+            change_count = self._pending_change_count(session)
+            session.commit()
+            self._pending_ops = 0
+            return change_count
+        except Exception:
+            # roll back on any error, but re-raise it unchanged so callers can tell
+            # retryable database failures apart
+            session.rollback()
+            self._pending_ops = 0
+            raise
 
-        for name, annotation in self.__annotations__.items():
-            if get_origin(annotation) is DbSet:
-                entity_type = get_args(annotation)[0]
-                dbset = DbSet(entity_type, self)
-                setattr(self, name, dbset)
+    def save_changes_bulk(self, entity_type: type[Any], rows: Iterable[Mapping[str, Any]]) -> int:
+        """Inserts rows of an entity type directly through a Core executemany INSERT and commits.
 
-        return metadata
+        This is the fastest way to load many rows, as it skips the ORM unit of work entirely: no
+        entities are created or tracked, relationships/backrefs are not maintained and cascades
+        are not applied. Any changes already pending in the session are committed along with it.
 
-    def save_changes(self) -> int:
-        """Attempts to persist changes to the database.
+        Args:
+            entity_type: The entity type whose table the rows are inserted into
+            rows: Column name -> value mappings; every row must provide the same columns
 
         Returns:
-            The total number of tracked changes in this operation
+            The number of rows inserted. Pending changes committed along with the rows are
+            not counted; call save_changes() first to get their count
+
+        Raises:
+            RuntimeError: If the entity type isn't configured in the context's `setup()`
         """
+        session = self._get_session()
+        table = _mapped_table(entity_type)
+        rows = list(rows)
         try:
-            session = self._get_session()
-            session.flush()
-            # capture counts before commit clears them
-            change_count = len(session.dirty) + len(session.new) + len(session.deleted)
+            if rows:
+                session.execute(insert(table), rows)
             session.commit()
-            return change_count
-        except Exception as e:
-            self._get_session().rollback()
-            raise Exception("Something went wrong when saving changes to the database") from e
+            self._pending_ops = 0
+            return len(rows)
+        except Exception:
+            session.rollback()
+            self._pending_ops = 0
+            raise
 
     def dispose(self) -> None:
         if self._session:
             self._session.close()
-        self._engine.dispose()
+        # the engine is shared, so it's only disposed along with the last context using it
+        if self._provider is not None and _release_engine(self._provider) is not None:
+            self._engine.dispose()
+        self._provider = None
 
     def __enter__(self) -> Self:
-        self._session = self._session_factory()
+        self._session = self._session_cls(**self._session_kwargs)
+        self._pending_ops = 0
         return self
 
     def __exit__(
         self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: Any
     ) -> None:
+        session = self._session
+        # nothing to commit or roll back if the session was never opened
+        if session is None:
+            return
         if exc_type is None:
             self.save_changes()
         else:
-            self._get_session().rollback()
-        self._get_session().close()
+            session.rollback()
+        session.close()
 
 
-class AsyncDbContext(ABC):
+class AsyncDbContext(_DbContextBase):
     """Asynchronous database context"""
 
-    def __init__(self, provider: DatabaseProvider[Any]):
-        connection_string = provider.get_connection_string()
-        opts = provider.get_engine_options()
+    __slots__ = ()
+
+    _dbset_type = AsyncDbSet
 
-        self._engine: AsyncEngine = create_async_engine(connection_string, **opts)
+    def __init__(self, provider: DatabaseProvider[Any]):
+        self._provider: DatabaseProvider[Any] | None = provider
+        self._metadata = self._init_dbsets()
+        # the engine is only acquired once setup() succeeded, so a failing setup can't leak it
+        self._engine: AsyncEngine = _acquire_engine(provider, create_async_engine)
         self._session_factory = async_sessionmaker(bind=self._engine, class_=AsyncSession)
+        self._session_cls = self._session_factory.class_
+        self._session_kwargs = self._session_factory.kw
         self._session: AsyncSession | None = None
-        self._metadata = self._init_dbsets()
+        # DbSet operations since the last commit, for batched save_changes calls
+        self._pending_ops = 0
 
     def _get_session(self) -> AsyncSession:
         """Internal method to get the session. Not part of public API."""
@@ -109,59 +272,99 @@ class AsyncDbContext(ABC):
             raise RuntimeError("Session not initialized. Use `async with`.")
         return self._session
 
-    @abstractmethod
-    def setup(self, builder: DbBuilder) -> None: ...
-
-    def _init_dbsets(self) -> MetaData:
-        metadata = MetaData()
-        builder = DbBuilder(metadata)
-
-        self.setup(builder)
-
-        builder._finalize()
+    async def save_changes(self, *, batch_size: int = 1) -> int:
+        """Attempts to persist changes to the database.
 
-        for name, annotation in self.__annotations__.items():
-            if get_origin(annotation) is AsyncDbSet:
-                entity_type = get_args(annotation)[0]
-                dbset = AsyncDbSet(entity_type, self)
-                setattr(self, name, dbset)
+        Args:
+            batch_size: The number of DbSet operations (adds, removes, ...) that must be pending
+                before changes are committed. Larger batches let save_changes() be called once per
+                entity while still committing in groups; anything deferred is committed by a later
+                call or when the context exits. Defaults to 1, which always commits.
 
-        return metadata
+        Returns:
+            The total number of tracked changes in this operation, or 0 if the commit was deferred
 
-    async def save_changes(self) -> int:
-        """Attempts to persist changes to the database.
+        Raises:
+            SQLAlchemyError: If the commit fails. The session is rolled back before any error
+                raised while committing is re-raised unchanged
+        """
+        session = self._get_session()
+        if batch_size > 1 and self._pending_ops < batch_size:
+            return 0
+        try:
+            # count pending changes before commit flushes and clears them
+            change_count = self._pending_change_count(session)
+            await session.commit()
+            self._pending_ops = 0
+            return change_count
+        except Exception:
+            # roll back on any error, but re-raise it unchanged so callers can tell
+            # retryable database failures apart
+            await session.rollback()
+            self._pending_ops = 0
+            raise
+
+    async def save_changes_bulk(
+        self, entity_type: type[Any], rows: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """Inserts rows of an entity type directly through a Core executemany INSERT and commits.
+
+        This is the fastest way to load many rows, as it skips the ORM unit of work entirely: no
+        entities are created or tracked, relationships/backrefs are not maintained and cascades
+        are not applied. Any changes already pending in the session are committed along with it.
+
+        Args:
+            entity_type: The entity type whose table the rows are inserted into
+            rows: Column name -> value mappings; every row must provide the same columns
 
         Returns:
-            The total number of tracked changes in this operation
+            The number of rows inserted. Pending changes committed along with the rows are
+            not counted; call save_changes() first to get their count
+
+        Raises:
+            RuntimeError: If the entity type isn't configured in the context's `setup()`
         """
+        session = self._get_session()
+        table = _mapped_table(entity_type)
+        rows = list(rows)
         try:
-            session = self._get_session()
-            await session.flush()
-            # capture counts before commit clears them
-            change_count = len(session.dirty) + len(session.new) + len(session.deleted)
+            if rows:
+                await session.execute(insert(table), rows)
             await session.commit()
-            return change_count
-        except Exception as e:
-            await self._get_session().rollback()
-            raise Exception("Something went wrong when saving changes to the database") from e
+            self._pending_ops = 0
+            return len(rows)
+        except Exception:
+            await session.rollback()
+            self._pending_ops = 0
+            raise
 
     async def dispose(self) -> None:
         if self._session:
             await self._session.close()
-        await self._engine.dispose()
+        if self._provider is not None and _release_engine(self._provider) is not None:
+            await self._engine.dispose()
+        self._provider = None
 
     async def __aenter__(self) -> Self:
-        async with self._engine.begin() as conn:
-            await conn.run_sync(self._metadata.create_all, checkfirst=True)
-
-        self._session = self._session_factory()
+        created = _SCHEMA_CREATED.setdefault(self._engine.sync_engine, set())
+        if type(self) not in created:
+            async with self._engine.begin() as conn:
+                await conn.run_sync(self._metadata.create_all, checkfirst=True)
+            created.add(type(self))
+
+        self._session = self._session_cls(**self._session_kwargs)
+        self._pending_ops = 0
         return self
 
     async def __aexit__(
         self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: Any
     ) -> None:
+        session = self._session
+        # nothing to commit or roll back if the session was never opened
+        if session is None:
+            return
         if exc_type is None:
             await self.save_changes()
         else:
-            await self._get_session().rollback()
-        await self._get_session().close()
+            await session.rollback()
+        await session.close()
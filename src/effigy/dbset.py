@@ -10,10 +10,16 @@ from typing import (
     TYPE_CHECKING,
     cast,
 )
-from sqlalchemy import ColumnElement, ResultProxy, select, update
+from functools import cached_property
+from operator import attrgetter
+from weakref import WeakSet
 
+from sqlalchemy import ColumnElement, ResultProxy, Select, Table, insert, select, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .entity import _EntityProxy
+
+from .entity import _get_entity_proxy
 
 
 if TYPE_CHECKING:
@@ -23,6 +29,89 @@ from .qb import QueryBuilder, AsyncQueryBuilder
 
 T = TypeVar("T")
 
+# rows per executemany INSERT issued by add_range
+_ADD_RANGE_BATCH_SIZE = 1000
+# rows fetched per batch when iterating over a DbSet
+_STREAM_BATCH_SIZE = 1000
+
+# entity types that already passed _validate_entity_type
+_VALIDATED_TYPES: "WeakSet[type]" = WeakSet()
+
+
+def _validate_entity_type(entity_type: type[Any]) -> None:
+    """Checks (once per type) that an entity type conforms to the Entity protocol.
+
+    Raises:
+        TypeError: If the type was not decorated with `@entity`
+    """
+    if entity_type in _VALIDATED_TYPES:
+        return
+
+    # @entity sets __tablename__ and __table__ along with the sentinel
+    if not getattr(entity_type, "__effigy_entity__", False):
+        raise TypeError(
+            f"{entity_type.__name__} does not conform to Entity protocol: "
+            f"missing __effigy_entity__ attribute. Did you forget the @entity decorator?"
+        )
+
+    _VALIDATED_TYPES.add(entity_type)
+
+
+def _mapped_table(entity_type: type[Any]) -> Table:
+    """Gets the table the builder created for an entity type.
+
+    Raises:
+        RuntimeError: If the entity wasn't configured in the context's `setup()`
+    """
+    table = getattr(entity_type, "__table__", None)
+    if table is None:
+        raise RuntimeError(
+            f"{entity_type.__name__} is not configured. Configure it with "
+            f"builder.entity({entity_type.__name__}) in the context's setup()."
+        )
+    return cast(Table, table)
+
+
+def _has_buffered_eager_loads(entity_type: type[Any]) -> bool:
+    """Checks whether an entity eagerly loads relationships in a way that rules out streaming.
+
+    Joined eager loads of collections repeat the parent row (so results must be uniqued), and
+    subquery loads buffer the result; neither can be streamed with `yield_per`.
+    """
+    mapper = sa_inspect(entity_type, raiseerr=False)
+    if mapper is None:
+        return False
+    return any(
+        rel.lazy == "subquery" or (rel.lazy == "joined" and rel.uselist)
+        for rel in mapper.relationships
+    )
+
+
+def _make_row_builder(table: Table) -> Callable[[Any], dict[str, Any]]:
+    """Builds a function that reads an entity's column values into an INSERT row.
+
+    The column reads are done by a single `attrgetter`. Primary keys that are unset (None)
+    are left out of the row so the database can generate them.
+    """
+    column_names = tuple(table.columns.keys())
+    pk_names = tuple(col.name for col in table.primary_key.columns)
+    getter = attrgetter(*column_names)
+
+    def drop_unset_keys(row: dict[str, Any]) -> dict[str, Any]:
+        for name in pk_names:
+            if row[name] is None:
+                del row[name]
+        return row
+
+    def to_row(entity: Any) -> dict[str, Any]:
+        return drop_unset_keys(dict(zip(column_names, getter(entity), strict=True)))
+
+    def single_column_to_row(entity: Any) -> dict[str, Any]:
+        # attrgetter returns a bare value (not a tuple) for a single attribute
+        return drop_unset_keys({column_names[0]: getter(entity)})
+
+    return single_column_to_row if len(column_names) == 1 else to_row
+
 
 class DbSet(Generic[T]):
     """Database set for querying and managing entities.
@@ -33,57 +122,108 @@ class DbSet(Generic[T]):
 
     def __init__(self, entity_type: Type[T], context: "DbContext"):
         # Runtime validation that the type conforms to Entity protocol
-        if not hasattr(entity_type, "__tablename__"):
-            raise TypeError(
-                f"{entity_type.__name__} does not conform to Entity protocol: "
-                f"missing __tablename__ attribute. Did you forget the @entity decorator?"
-            )
-
-        # Note: __table__ might be None initially, will be set by builder
-        if not hasattr(entity_type, "__table__"):
-            raise TypeError(
-                f"{entity_type.__name__} does not conform to Entity protocol: "
-                f"missing __table__ attribute. Did you forget the @entity decorator?"
-            )
+        _validate_entity_type(entity_type)
 
         self._entity_type = entity_type
         self._context = context
 
+    # the statements are built on first use, so a DbSet for an entity that setup() didn't
+    # configure can still be created and fails with a clear error only when it's used
+    @cached_property
+    def _table(self) -> Table:
+        return _mapped_table(self._entity_type)
+
+    @cached_property
+    def _select_all(self) -> Select[T]:
+        # fail with a clear error rather than SQLAlchemy's if the entity isn't mapped
+        _mapped_table(self._entity_type)
+        return select(self._entity_type)
+
+    @cached_property
+    def _stream_all(self) -> Select[T]:
+        return self._select_all.execution_options(yield_per=_STREAM_BATCH_SIZE)
+
+    @cached_property
+    def _buffered_loads(self) -> bool:
+        return _has_buffered_eager_loads(self._entity_type)
+
+    @cached_property
+    def _to_row(self) -> Callable[[Any], dict[str, Any]]:
+        # only add_range needs it
+        return _make_row_builder(self._table)
+
     def add(self, entity: T) -> T:
         self._context._get_session().add(entity)
+        self._context._pending_ops += 1
         return entity
 
     def add_range(self, entities: Iterable[T]) -> None:
-        elist = list(entities)
-        self._context._get_session().bulk_save_objects(elist)
+        """Inserts entities with batched executemany INSERT statements.
+
+        Like `bulk_save_objects`, the entities are not added to the session, so database
+        generated values (e.g. autoincrement keys) are not populated on them.
+        """
+        session = self._context._get_session()
+        statement = insert(self._table)
+        to_row = self._to_row
+
+        batch: list[dict[str, Any]] = []
+        batch_keys: tuple[str, ...] = ()
+        inserted = 0
+        for entity in entities:
+            row = to_row(entity)
+            row_keys = tuple(row)
+            # an executemany batch must bind the same columns for every row
+            if batch and (row_keys != batch_keys or len(batch) >= _ADD_RANGE_BATCH_SIZE):
+                session.execute(statement, batch)
+                inserted += len(batch)
+                batch = []
+            batch_keys = row_keys
+            batch.append(row)
+        if batch:
+            session.execute(statement, batch)
+            inserted += len(batch)
+
+        self._context._pending_ops += inserted
 
     def update_where(self, predicate: Callable[[T], bool], **updates: Any) -> None:
-        proxy = _EntityProxy(self._entity_type)
+        proxy = _get_entity_proxy(self._entity_type)
         filterexpr = predicate(cast(T, proxy))
         statement = (
-            # we know that __table__ will exist by now
-            update(getattr(self._entity_type, "__table__"))
+            update(self._table)
             .where(cast(ColumnElement[bool], filterexpr))
             .values(**updates)
         )
         self._context._get_session().execute(statement)
+        self._context._pending_ops += 1
 
     def remove(self, entity: T) -> None:
         self._context._get_session().delete(entity)
+        self._context._pending_ops += 1
 
     def where(self, predicate: Callable[[T], bool]) -> QueryBuilder[T]:
-        qb = QueryBuilder(self._entity_type, self._context._get_session())
-        return qb.where(predicate)
+        return self._qb().where(predicate)
 
     def include(self, navigation: Callable[[T], Any]) -> QueryBuilder[T]:
-        qb = QueryBuilder(self._entity_type, self._context._get_session())
-        return qb.include(navigation)
+        return self._qb().include(navigation)
+
+    def _qb(self) -> QueryBuilder[T]:
+        # select statements are immutable, so every builder can start from the cached one
+        return QueryBuilder(self._entity_type, self._context._get_session(), self._select_all)
 
     def to_list(self) -> list[T]:
-        return self._context._get_session().query(self._entity_type).all()
+        result = self._context._get_session().scalars(self._select_all)
+        if self._buffered_loads:
+            result = result.unique()
+        return list(result)
 
     def __iter__(self) -> Iterator[T]:
-        return iter(self.to_list())
+        # not a generator, so the query runs (and a missing session is reported) on iter()
+        if self._buffered_loads:
+            # yield_per can't be combined with eager loaders that need the whole result
+            return iter(self.to_list())
+        # rows are fetched in batches as they are consumed, rather than all up front
+        return iter(self._context._get_session().scalars(self._stream_all))
 
 
 class AsyncDbSet(Generic[T]):
@@ -95,44 +235,67 @@ class AsyncDbSet(Generic[T]):
 
     def __init__(self, entity_type: Type[T], context: "AsyncDbContext"):
         # Runtime validation that the type conforms to Entity protocol
-        if not hasattr(entity_type, "__tablename__"):
-            raise TypeError(
-                f"{entity_type.__name__} does not conform to Entity protocol: "
-                f"missing __tablename__ attribute. Did you forget the @entity decorator?"
-            )
-
-        if not hasattr(entity_type, "__table__"):
-            raise TypeError(
-                f"{entity_type.__name__} does not conform to Entity protocol: "
-                f"missing __table__ attribute. Did you forget the @entity decorator?"
-            )
+        _validate_entity_type(entity_type)
 
         self._entity_type = entity_type
         self._context = context
 
+    # the statements are built on first use, so a DbSet for an entity that setup() didn't
+    # configure can still be created and fails with a clear error only when it's used
+    @cached_property
+    def _table(self) -> Table:
+        return _mapped_table(self._entity_type)
+
+    @cached_property
+    def _select_all(self) -> Select[T]:
+        # fail with a clear error rather than SQLAlchemy's if the entity isn't mapped
+        _mapped_table(self._entity_type)
+        return select(self._entity_type)
+
+    @cached_property
+    def _stream_all(self) -> Select[T]:
+        return self._select_all.execution_options(yield_per=_STREAM_BATCH_SIZE)
+
+    @cached_property
+    def _buffered_loads(self) -> bool:
+        return _has_buffered_eager_loads(self._entity_type)
+
     def add(self, entity: T) -> T:
         self._context._get_session().add(entity)
+        self._context._pending_ops += 1
         return entity
 
     async def remove(self, entity: T) -> None:
         await self._context._get_session().delete(entity)
+        self._context._pending_ops += 1
 
     def where(self, predicate: Callable[[T], bool]) -> AsyncQueryBuilder[T]:
-        qb = AsyncQueryBuilder(self._entity_type, self._context._get_session())
-        return qb.where(predicate)
+        return self._qb().where(predicate)
 
     def include(self, navigation: Callable[[T], Any]) -> AsyncQueryBuilder[T]:
-        qb = AsyncQueryBuilder(self._entity_type, self._context._get_session())
-        return qb.include(navigation)
+        return self._qb().include(navigation)
+
+    def _qb(self) -> AsyncQueryBuilder[T]:
+        # select statements are immutable, so every builder can start from the cached one
+        return AsyncQueryBuilder(self._entity_type, self._context._get_session(), self._select_all)
 
     async def to_list(self) -> list[T]:
-        exc = await self._context._get_session().execute(select(self._entity_type))
-        return list(exc.scalars())
+        exc = await self._context._get_session().execute(self._select_all)
+        result = exc.scalars()
+        if self._buffered_loads:
+            result = result.unique()
+        return list(result)
 
     def __aiter__(self) -> AsyncIterator[T]:
-        return self._async_iterator()
-
-    async def _async_iterator(self) -> AsyncIterator[T]:
-        entities = await self.to_list()
-        for entity in entities:
+        # the session is checked up front, so a missing one is reported by aiter() itself
+        return self._async_iterator(self._context._get_session())
+
+    async def _async_iterator(self, session: AsyncSession) -> AsyncIterator[T]:
+        if self._buffered_loads:
+            # yield_per can't be combined with eager loaders that need the whole result
+            for entity in await self.to_list():
+                yield entity
+            return
+        result = await session.stream_scalars(self._stream_all)
+        async for entity in result:
             yield entity
@@ -1,6 +1,12 @@
-from typing import Generic, Type, TypeVar, Protocol, Any, get_origin, cast
+import inspect
+import re
+from functools import lru_cache
+from collections.abc import Callable
+from typing import Generic, Type, TypeVar, Protocol, Any, get_args, get_origin, cast
+from weakref import WeakKeyDictionary
 from typing_extensions import dataclass_transform
 from attrs import define, field
+from sqlalchemy.orm.attributes import set_committed_value
 
 T = TypeVar("T")
 TEntity = TypeVar("TEntity", bound="Entity[Any]")
@@ -28,6 +34,8 @@ class Entity(Protocol[T]):
 class _MockAttribute:
     """Mock that mimics SQLAlchemy's InstrumentedAttribute interface."""
 
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
         self.key = key
 
@@ -43,19 +51,21 @@ class _EntityProxy(Generic[T]):
     entity type and prevents attribute mutations during navigation.
     """
 
+    __slots__ = ("_entity_type", "_type_hints")
+
     def __init__(self, entity_type: Type[T]):
         object.__setattr__(self, "_entity_type", entity_type)
         # forward references in annotations are fine since we only need field names for validation
         type_hints = getattr(entity_type, "__annotations__", {})
         object.__setattr__(self, "_type_hints", type_hints)
 
-    def __getattribute__(self, name: str) -> Any:
-        # we want to allow access to internal attributes
+    def __getattr__(self, name: str) -> Any:
+        # only called when normal lookup fails, i.e. for properties that aren't on a shadow class
         if name.startswith("_"):
-            return object.__getattribute__(self, name)
+            raise AttributeError(name)
 
-        entity_type: Type[T] = object.__getattribute__(self, "_entity_type")
-        type_hints: dict[str, Any] = object.__getattribute__(self, "_type_hints")
+        entity_type: Type[T] = self._entity_type
+        type_hints: dict[str, Any] = self._type_hints
 
         if name not in type_hints:
             available = ", ".join(type_hints.keys())
@@ -67,13 +77,88 @@ class _EntityProxy(Generic[T]):
         return _MockAttribute(name)
 
     def __setattr__(self, name: str, value: Any) -> None:
-        entity_type: Type[T] = object.__getattribute__(self, "_entity_type")
+        entity_type: Type[T] = self._entity_type
         raise AttributeError(
             f"Cannot set attribute '{name}={value}' during navigation on {entity_type.__name__}. "
             f"Navigation lambdas should only read attributes, not modify them."
         )
 
 
+def _build_entity_proxy(entity_type: type[T]) -> _EntityProxy[T]:
+    """Builds the navigation proxy for an entity type.
+
+    The proxy is an instance of a shadow class built for the entity type, which holds a
+    `_MockAttribute` per declared property as a class attribute. Navigating to a declared
+    property is then a plain attribute lookup, while unknown properties still fall through
+    to `_EntityProxy.__getattr__` and raise.
+    """
+    type_hints = getattr(entity_type, "__annotations__", {})
+    namespace: dict[str, Any] = {
+        name: _MockAttribute(name) for name in type_hints if not name.startswith("_")
+    }
+    namespace["__slots__"] = ()
+    shadow = type(f"_{entity_type.__name__}Proxy", (_EntityProxy,), namespace)
+    return cast(_EntityProxy[T], shadow(entity_type))
+
+
+def _get_entity_proxy(entity_type: type[T]) -> _EntityProxy[T]:
+    """Gets the shared navigation proxy for an entity type.
+
+    Proxies hold no state beyond the entity type and can't be mutated, so a single proxy
+    per entity type is reused by every navigation lambda. The `@entity` decorator builds
+    it up front; other types get theirs on first use.
+    """
+    proxy = entity_type.__dict__.get("__effigy_proxy__")
+    if proxy is None:
+        proxy = _build_entity_proxy(entity_type)
+        cast(Any, entity_type).__effigy_proxy__ = proxy
+    return cast(_EntityProxy[T], proxy)
+
+
+# default factories for unset collection-typed fields, keyed by the annotation's origin;
+# tuples only get one when they're variable-length (tuple[X, ...]), see _default_factory
+_FACTORY_MAP: dict[Any, Callable[[], Any]] = {
+    list: list,
+    dict: dict,
+    set: set,
+    frozenset: frozenset,
+    tuple: tuple,
+}
+
+
+def _default_factory(attr_type: Any) -> Callable[[], Any] | None:
+    """Gets the default factory for a collection-typed field annotation, if it has one."""
+    # get_origin returns the unparameterized version of generic types
+    # e.g., list for list[int], dict for dict[str, int], etc.
+    origin = get_origin(attr_type)
+    # a fixed-length tuple (e.g. tuple[int, int]) has no sensible empty default
+    if origin is tuple and get_args(attr_type)[1:] != (Ellipsis,):
+        return None
+    return _FACTORY_MAP.get(origin)
+
+
+# names of the mapped many-to-one relationships of each entity class, added by the DbBuilder
+_REFERENCES: "WeakKeyDictionary[type, frozenset[str]]" = WeakKeyDictionary()
+
+
+def _add_reference(entity_type: type[Any], navigation_name: str) -> None:
+    """Registers a mapped many-to-one relationship of an entity class."""
+    _REFERENCES[entity_type] = _REFERENCES.get(entity_type, frozenset()) | {navigation_name}
+
+
+def _forget_unset_references(self: Any) -> None:
+    """Drops the change history of many-to-one references the constructor set to None.
+
+    Every field is assigned by the generated constructor, and SQLAlchemy treats a reference
+    assigned None as removed, clearing its foreign key when the entity is saved. References
+    left as None are recorded as unchanged instead, so a foreign key value passed to the
+    constructor is kept.
+    """
+    for key in _REFERENCES.get(type(self), ()):
+        if getattr(self, key) is None:
+            set_committed_value(self, key, None)
+
+
 @dataclass_transform(kw_only_default=False, field_specifiers=(field,))
 def entity(c: Type[T]) -> Type[Entity[T]]:
     """A decorator that can be used to define an effigy class.
@@ -102,41 +187,60 @@ def entity(c: Type[T]) -> Type[Entity[T]]:
         A decorated class that conforms to the effigy entity protocol
     """
 
-    annotations = c.__annotations__ if hasattr(c, "__annotations__") else {}
+    # the class's own annotations, without walking the MRO
+    annotations = inspect.get_annotations(c)
 
     for attr_name, attr_type in annotations.items():
-        if not hasattr(c, attr_name):
-            origin = get_origin(attr_type)
-            # get_origin returns the unparameterized version of generic types
-            # e.g., list for list[int], dict for dict[str, int], etc.
-            if origin is list:  # type: ignore[comparison-overlap]
-                setattr(c, attr_name, field(factory=list))
-            elif origin is dict:  # type: ignore[comparison-overlap]
-                setattr(c, attr_name, field(factory=dict))
-            elif origin is set:  # type: ignore[comparison-overlap]
-                setattr(c, attr_name, field(factory=set))
-
-    effigy_cls = define(c, kw_only=False, slots=False)
-    if not hasattr(effigy_cls, "__tablename__"):
-        setattr(effigy_cls, "__tablename__", _pluralize(c.__name__.lower()))
+        # only fields without a default declared on this class itself
+        if attr_name not in c.__dict__:
+            factory = _default_factory(attr_type)
+            if factory is not None:
+                setattr(c, attr_name, field(factory=factory))
+
+    # the entity attributes go on the class before define(), so they're in place along with the
+    # generated methods; with slots=False attrs patches the class rather than creating a new one
+    # checked on the class itself, so subclasses of an entity get their own table
+    if "__tablename__" not in c.__dict__:
+        setattr(c, "__tablename__", _pluralize(c.__name__.lower()))
 
     # Initialize __table__ to None - will be set by DbBuilder during context init
-    if not hasattr(effigy_cls, "__table__"):
-        setattr(effigy_cls, "__table__", None)
+    if "__table__" not in c.__dict__:
+        setattr(c, "__table__", None)
 
-    setattr(effigy_cls, "__effigy_entity__", True)
-    setattr(effigy_cls, "__effigy_entity_type__", c)
+    setattr(c, "__effigy_entity__", True)
+    setattr(c, "__effigy_entity_type__", c)
+
+    # chained after a post-init hook the class already has, e.g. one of its own
+    post_init = getattr(c, "__attrs_post_init__", None)
+    if post_init is None:
+        cast(Any, c).__attrs_post_init__ = _forget_unset_references
+    elif post_init is not _forget_unset_references:
+
+        def __attrs_post_init__(self: Any) -> None:
+            post_init(self)
+            _forget_unset_references(self)
+
+        cast(Any, c).__attrs_post_init__ = __attrs_post_init__
+
+    effigy_cls = define(c, kw_only=False, slots=False)
+    cast(Any, effigy_cls).__effigy_proxy__ = _build_entity_proxy(effigy_cls)
 
     # attrs.define generates __init__ from annotations
     # dataclass_transform decorator tells mypy how to handle this
     return cast(type[Entity[T]], effigy_cls)
 
 
+# one pass over the word's ending: consonant + y, consonant + z, or a sibilant ending
+_PLURAL_RE = re.compile(r"(?<=[^aeiou])(y)\Z|(?<=[^aeiou])(z)\Z|(?:s|x|z|ch|sh)\Z")
+
+
+@lru_cache(maxsize=256)
 def _pluralize(s: str) -> str:
-    if s.endswith("y") and len(s) > 1 and s[-2] not in "aeiou":
+    m = _PLURAL_RE.search(s)
+    if m is None:
+        return s + "s"
+    if m.group(1):
         return s[:-1] + "ies"
-    elif s.endswith("z") and len(s) > 1 and s[-2] not in "aeiou":
+    if m.group(2):
         return s + "zes"
-    elif s.endswith(("s", "x", "z", "ch", "sh")):
-        return s + "es"
-    return s + "s"
+    return s + "es"
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Any, TypeVar, Generic
 
 from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy.pool import Pool, QueuePool
 
 
 E = TypeVar("E", bound="BaseEngineOptions", covariant=True)
@@ -39,23 +40,33 @@ class BaseEngineOptions(BaseModel):
     pool_timeout: float = Field(default=60.0)
     pool_recycle: float = Field(default=3600)
     pool_preping: bool = Field(default=False)
+    # reuse the most recently returned connection first, so surplus connections can idle out
+    pool_use_lifo: bool = Field(default=True)
     isolation_level: str | None = Field(default=None)
+    # the engine picks a suitable pool when unset (AsyncAdaptedQueuePool for async engines);
+    # async engines only accept asyncio-compatible pools
+    poolclass: type[Pool] | None = Field(default=None)
     connect_args: dict[str, Any] = Field(default_factory=dict)
 
     def to_engine_opts(self) -> dict[str, Any]:
         """Converts this engine options instance into SQLAlchemy engine keyword arguments"""
 
         opts: dict[str, Any] = {
-            "pool_size": self.pool_size,
             "echo": self.echo,
             "echo_pool": self.echo_pool,
-            "max_overflow": self.max_overflow,
-            "pool_timeout": self.pool_timeout,
             "pool_recycle": self.pool_recycle,
-            "pool_preping": self.pool_preping,
+            "pool_pre_ping": self.pool_preping,
         }
+        # only queue pools are sized; others (e.g. NullPool, StaticPool) reject these arguments
+        if self.poolclass is None or issubclass(self.poolclass, QueuePool):
+            opts["pool_size"] = self.pool_size
+            opts["max_overflow"] = self.max_overflow
+            opts["pool_timeout"] = self.pool_timeout
+            opts["pool_use_lifo"] = self.pool_use_lifo
         if self.isolation_level is not None:
             opts["isolation_level"] = self.isolation_level
+        if self.poolclass is not None:
+            opts["poolclass"] = self.poolclass
         if self.connect_args:
             opts["connect_args"] = self.connect_args
         return opts
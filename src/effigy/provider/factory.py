@@ -1,4 +1,6 @@
-from typing import Any, Literal
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar, Literal
 
 from effigy.provider.mysql import MySqlProvider, MySqlEngineOptions
 from effigy.provider.pg import PostgresProvider, PostgresEngineOptions
@@ -8,10 +10,22 @@ from .memory import InMemoryProvider, InMemoryEngineOptions
 
 ProviderType = Literal["inmemory", "postgres", "mysql"]
 
+# read-only, so the dispatch table can't be modified at runtime
+_PROVIDERS: Mapping[str, type[DatabaseProvider[Any]]] = MappingProxyType(
+    {
+        "inmemory": InMemoryProvider,
+        "mysql": MySqlProvider,
+        "postgres": PostgresProvider,
+    }
+)
+
 
 class ProviderFactory:
     """Factory for creating database provider instances."""
 
+    # read-only view of the provider class registered for each provider type
+    providers: ClassVar[Mapping[str, type[DatabaseProvider[Any]]]] = _PROVIDERS
+
     @staticmethod
     def create_provider(
         provider_type: ProviderType,
@@ -29,11 +43,7 @@ class ProviderFactory:
         Raises:
             ValueError: If an unknown provider type is specified
         """
-        if provider_type == "inmemory":
-            return InMemoryProvider(opt)  # type: ignore[arg-type]
-        elif provider_type == "mysql":
-            return MySqlProvider(opt)  # type: ignore[arg-type]
-        elif provider_type == "postgres":
-            return PostgresProvider(opt)  # type: ignore[arg-type]
-        else:
+        provider_cls = _PROVIDERS.get(provider_type)
+        if provider_cls is None:
             raise ValueError(f"Unknown provider type: {provider_type}")
+        return provider_cls(opt)
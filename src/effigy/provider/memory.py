@@ -24,9 +24,7 @@ class InMemoryEngineOptions(BaseEngineOptions):
 
         # For sync mode, we need check_same_thread=False for SQLite
         if not self.use_async:
-            connect_args = self.connect_args.copy() if self.connect_args else {}
-            connect_args["check_same_thread"] = False
-            opts["connect_args"] = connect_args
+            opts["connect_args"] = {**self.connect_args, "check_same_thread": False}
         elif self.connect_args:
             opts["connect_args"] = self.connect_args.copy()
 
@@ -41,11 +39,13 @@ class InMemoryProvider(DatabaseProvider[InMemoryEngineOptions]):
 
     def __init__(self, options: InMemoryEngineOptions):
         self._opt = options
+        # options are frozen, so the connection string is built once
+        self._conn_str = (
+            "sqlite+aiosqlite:///:memory:" if options.use_async else "sqlite:///:memory:"
+        )
 
     def get_connection_string(self) -> str:
-        if self._opt.use_async:
-            return "sqlite+aiosqlite:///:memory:"
-        return "sqlite:///:memory:"
+        return self._conn_str
 
     def get_engine_options(self) -> dict[str, Any]:
         return self._opt.to_engine_opts()
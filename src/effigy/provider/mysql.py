@@ -34,9 +34,13 @@ class MySqlEngineOptions(BaseEngineOptions):
 
 class MySqlProvider(DatabaseProvider[MySqlEngineOptions]):
 
-    def get_connection_string(self) -> str:
-        driver = "aiomysql" if self._opt.use_async else "pymysql"
-        pw = quote_plus(self._opt.password) if self._opt.password else ""
-        auth = f"{self._opt.username}:{pw}@" if pw else f"{self._opt.username}"
+    def __init__(self, options: MySqlEngineOptions):
+        super().__init__(options)
+        # options are frozen, so the connection string is built once
+        driver = "aiomysql" if options.use_async else "pymysql"
+        pw = quote_plus(options.password) if options.password else ""
+        auth = f"{options.username}:{pw}@" if pw else f"{options.username}"
+        self._conn_str = f"mysql+{driver}://{auth}{options.host}:{options.port}/{options.database}"
 
-        return f"mysql+{driver}://{auth}{self._opt.host}:{self._opt.port}/{self._opt.database}"
+    def get_connection_string(self) -> str:
+        return self._conn_str
@@ -40,10 +40,15 @@ class PostgresEngineOptions(BaseEngineOptions):
 
 class PostgresProvider(DatabaseProvider[PostgresEngineOptions]):
 
-    def get_connection_string(self) -> str:
-
-        driver = "asyncpg" if self._opt.use_async else "psycopg2"
-        pw = quote_plus(self._opt.password) if self._opt.password else ""
-        auth = f"{self._opt.username}:{pw}@" if pw else f"{self._opt.username}"
+    def __init__(self, options: PostgresEngineOptions):
+        super().__init__(options)
+        # options are frozen, so the connection string is built once
+        driver = "asyncpg" if options.use_async else "psycopg2"
+        pw = quote_plus(options.password) if options.password else ""
+        auth = f"{options.username}:{pw}@" if pw else f"{options.username}"
+        self._conn_str = (
+            f"postgresql+{driver}://{auth}{options.host}:{options.port}/{options.database}"
+        )
 
-        return f"postgresql+{driver}://{auth}{self._opt.host}:{self._opt.port}/{self._opt.database}"
+    def get_connection_string(self) -> str:
+        return self._conn_str
@@ -34,18 +34,26 @@ class _IncludeChain:
 class _QueryBuilderBase(Generic[T]):
     """Base class for all query builders containing shared query building logic."""
 
-    def __init__(self, entity_type: type[T], session: Session | AsyncSession):
+    def __init__(
+        self,
+        entity_type: type[T],
+        session: Session | AsyncSession,
+        statement: Select[T] | None = None,
+    ):
         self._entity_type = entity_type
         self._session = session
-        self._statement: Select[tuple[T]] = select(entity_type)
+        self._statement: Select[T] = statement if statement is not None else select(entity_type)
         self._includes: list[_IncludeChain] = []
         self._chain: _IncludeChain | None = None
+        # statement with include options applied, reset by every builder method
+        self._compiled: Select[T] | None = None
 
     def where(self, predicate: Callable[[T], bool]) -> Self:
         # We pass the entity class type, but signature says instance for user convenience
         # SQLAlchemy's mapped class attributes work like instance attributes at runtime
         filter_expr = predicate(self._entity_type)  # type: ignore[arg-type]
         self._statement = self._statement.where(cast(ColumnElement[bool], filter_expr))
+        self._compiled = None
         return self
 
     def include(self, navigation: Callable[[T], Any]) -> Self:
@@ -54,6 +62,7 @@ class _QueryBuilderBase(Generic[T]):
 
         self._chain = _IncludeChain(root=relationship, thens=[])
         self._includes.append(self._chain)
+        self._compiled = None
 
         return self
 
@@ -61,39 +70,48 @@ class _QueryBuilderBase(Generic[T]):
         if not self._chain:
             raise RuntimeError("then_include(...) must be called after include(...)")
         self._chain.thens.append(navigation)
+        self._compiled = None
         return self
 
     def order_by(self, key: Callable[[T], Any], *, desc: bool = False) -> Self:
         # We pass the entity class type, but signature says instance for user convenience
         column = key(self._entity_type)  # type: ignore[arg-type]
         self._statement = self._statement.order_by(column if not desc else column.desc())
+        self._compiled = None
         return self
 
-    def _compile(self) -> Select[tuple[T]]:
+    def _compile(self) -> Select[T]:
+        # reused across executions, e.g. any() followed by to_list()
+        if self._compiled is not None:
+            return self._compiled
         statement = self._statement
         for include in self._includes:
             load = include.to_load_opts()
             statement = statement.options(load)
+        self._compiled = statement
         return statement
 
     def skip(self, count: int) -> Self:
         self._statement = self._statement.offset(count)
+        self._compiled = None
         return self
 
     def take(self, count: int) -> Self:
         self._statement = self._statement.limit(count)
+        self._compiled = None
         return self
 
     def distinct(self) -> Self:
         self._statement = self._statement.distinct()
+        self._compiled = None
         return self
 
 
 class QueryBuilder(_QueryBuilderBase[T]):
     """Synchronous query builder utility"""
 
-    def __init__(self, entity_type: Type[T], session: Session):
-        super().__init__(entity_type, session)
+    def __init__(self, entity_type: Type[T], session: Session, statement: Select[T] | None = None):
+        super().__init__(entity_type, session, statement)
         # for typehinting purposes, reassign to narrow type
         self._session: Session = session
 
@@ -130,8 +148,10 @@ class QueryBuilder(_QueryBuilderBase[T]):
 class AsyncQueryBuilder(_QueryBuilderBase[T]):
     """Asynchronous query builder utility"""
 
-    def __init__(self, entity_type: Type[T], session: AsyncSession):
-        super().__init__(entity_type, session)
+    def __init__(
+        self, entity_type: Type[T], session: AsyncSession, statement: Select[T] | None = None
+    ):
+        super().__init__(entity_type, session, statement)
         # for typehinting purposes, reassign to narrow type
         self._session: AsyncSession = session
 
@@ -1,7 +1,8 @@
+import warnings
 from typing import Optional
 
 import pytest
-from sqlalchemy import Boolean, Float, Integer, String, inspect
+from sqlalchemy import Boolean, Float, Integer, MetaData, String, inspect
 from effigy.builder.core import DbBuilder
 from effigy.context import DbContext
 from effigy.dbset import DbSet
@@ -230,6 +231,95 @@ class TestTableCreation:
         with pytest.raises(TypeError, match="unsupported union type"):
             TestContext(provider)
 
+    def test_warns_on_unmapped_field_type(self) -> None:
+        """Annotations without a column type mapping should warn and default to String"""
+
+        class Currency:
+            pass
+
+        @entity
+        class Price:
+            id: int
+            currency: Currency
+
+        class TestContext(DbContext):
+            prices: DbSet[Price]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(Price).has_key(lambda p: p.id)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+
+        match = "No column type mapping for Price.currency"
+        with pytest.warns(UserWarning, match=match) as record:
+            ctx = TestContext(provider)
+        try:
+            assert isinstance(Price.__table__.c.currency.type, String)
+            # the warning points at the code that built the context, not at effigy
+            assert record[0].filename == __file__
+        finally:
+            ctx.dispose()
+
+        # warned again for every context that maps the field, not once per process
+        with pytest.warns(UserWarning, match=match):
+            TestContext(provider).dispose()
+
+    def test_skips_navigation_fields(self) -> None:
+        """Fields typed as other entities are navigation properties, not columns"""
+
+        @entity
+        class Owner:
+            id: int
+
+        @entity
+        class Pet:
+            id: int
+            owner_id: int
+            owner: Owner | None = None
+
+        class TestContext(DbContext):
+            owners: DbSet[Owner]
+            pets: DbSet[Pet]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(Owner).has_key(lambda o: o.id)
+                builder.entity(Pet).has_key(lambda p: p.id)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            ctx = TestContext(provider)
+        try:
+            assert list(Pet.__table__.c.keys()) == ["id", "owner_id"]
+        finally:
+            ctx.dispose()
+
+    def test_skips_immutable_collection_fields(self) -> None:
+        """frozenset and tuple fields are collections, not columns"""
+
+        @entity
+        class Tagged:
+            id: int
+            tags: frozenset[str]
+            aliases: tuple[str, ...]
+
+        class TestContext(DbContext):
+            tagged: DbSet[Tagged]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(Tagged).has_key(lambda t: t.id)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            ctx = TestContext(provider)
+        try:
+            assert list(Tagged.__table__.c.keys()) == ["id"]
+        finally:
+            ctx.dispose()
+
     def test_requires_at_least_one_primary_key(self) -> None:
         """Entities without primary keys should raise ValueError"""
 
@@ -249,6 +339,25 @@ class TestTableCreation:
         with pytest.raises(ValueError, match="must have at least one primary key"):
             TestContext(provider)
 
+    def test_requires_primary_key_to_map_to_a_column(self) -> None:
+        """Keys configured only on non-column attributes should raise ValueError"""
+
+        @entity
+        class CollectionKey:
+            name: str
+            tags: list[str]
+
+        class TestContext(DbContext):
+            entities: DbSet[CollectionKey]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(CollectionKey).has_key(lambda c: c.tags)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+
+        with pytest.raises(ValueError, match="must have at least one primary key column"):
+            TestContext(provider)
+
     def test_creates_sqlalchemy_mapper(self) -> None:
         """Entities should be registered with SQLAlchemy ORM mapper"""
 
@@ -274,6 +383,44 @@ class TestTableCreation:
         finally:
             ctx.dispose()
 
+    def test_type_hints_resolved_once_per_entity(self) -> None:
+        """Column fields should be cached and reused across context instances"""
+        from effigy.builder.core import _ENTITY_FIELDS
+
+        @entity
+        class Product:
+            id: int
+            name: str
+
+        class TestContext(DbContext):
+            products: DbSet[Product]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(Product).has_key(lambda p: p.id)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+        ctx1 = TestContext(provider)
+        fields = _ENTITY_FIELDS[Product]
+        ctx2 = TestContext(provider)
+        try:
+            assert _ENTITY_FIELDS[Product] is fields
+            assert [(f.name, f.field_type) for f in fields] == [("id", int), ("name", str)]
+        finally:
+            ctx1.dispose()
+            ctx2.dispose()
+
+    def test_unresolved_type_hints_are_not_cached(self) -> None:
+        """Fields introspected from unresolvable annotations should be retried on the next build"""
+        from effigy.builder.core import _ENTITY_FIELDS, _entity_fields
+
+        @entity
+        class Shipment:
+            id: int
+            carrier: "Carrier | None" = None  # noqa: F821
+
+        _entity_fields(Shipment)
+        assert Shipment not in _ENTITY_FIELDS
+
 
 class TestPropertyConfiguration:
     """Tests for property configuration (unique, required, default)"""
@@ -492,6 +639,40 @@ class RelTestPostBidir:
     user: RelTestUserBidir | None = None
 
 
+@entity
+class RelTestAuthor:
+    id: int
+    books: list["RelTestBook"]
+
+
+@entity
+class RelTestBook:
+    id: int
+    author_id: int
+    author: RelTestAuthor | None = None
+
+
+@entity
+class RelTestOrder:
+    id: int
+    lines: list["RelTestOrderLine"]
+
+
+@entity
+class RelTestOrderLine:
+    id: int
+    order_id: int
+    order: RelTestOrder | None = None
+
+
+@entity
+class RelTestComment:
+    id: int
+    body: str
+    post_id: int
+    post: Optional["RelTestPostBidir"] = None
+
+
 class TestRelationshipCreation:
     """Tests for DbBuilder._create_relationships() functionality"""
 
@@ -511,15 +692,10 @@ class TestRelationshipCreation:
         provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
         ctx = TestContext(provider)
         try:
-            # verify relationship was created
-            assert hasattr(RelTestUser, "posts")
-            posts_rel = getattr(RelTestUser, "posts")
-            assert posts_rel is not None
-
-            # verify it's a SQLAlchemy relationship object
-            from sqlalchemy.orm.relationships import _RelationshipDeclared
-
-            assert isinstance(posts_rel, _RelationshipDeclared)
+            # verify the relationship was mapped
+            posts_rel = inspect(RelTestUser).relationships["posts"]
+            assert posts_rel.mapper.class_ is RelTestPost
+            assert posts_rel.uselist
         finally:
             ctx.dispose()
 
@@ -551,15 +727,98 @@ class TestRelationshipCreation:
         provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
         ctx = TestContext(provider)
         try:
-            # verify relationship was created
-            assert hasattr(Post, "user")
-            user_rel = getattr(Post, "user")
-            assert user_rel is not None
+            # verify the relationship was mapped
+            user_rel = inspect(Post).relationships["user"]
+            assert user_rel.mapper.class_ is User
+            assert not user_rel.uselist
+
+            # verify the foreign key constraint was declared
+            (foreign_key,) = Post.__table__.c.user_id.foreign_keys
+            assert foreign_key.column is User.__table__.c.id
+        finally:
+            ctx.dispose()
+
+    def test_relationships_eager_load_by_default(self) -> None:
+        """Collections should default to selectin loading and references to joined loading"""
+
+        class TestContext(DbContext):
+            authors: DbSet[RelTestAuthor]
+            books: DbSet[RelTestBook]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(RelTestAuthor).has_key(lambda a: a.id).has_many(
+                    lambda a: a.books
+                ).with_foreign_key(lambda b: b.author_id).backpopulates(lambda b: b.author)
+                builder.entity(RelTestBook).has_key(lambda b: b.id).has_one(
+                    lambda b: b.author
+                ).with_foreign_key(lambda b: b.author_id).backpopulates(lambda a: a.books)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+        ctx = TestContext(provider)
+        try:
+            assert inspect(RelTestAuthor).relationships["books"].lazy == "selectin"
+            assert inspect(RelTestBook).relationships["author"].lazy == "joined"
+        finally:
+            ctx.dispose()
+
+    def test_delete_cascade_enables_passive_deletes(self) -> None:
+        """Delete cascades should enable passive deletes unless configured explicitly"""
 
-            # verify it's a SQLAlchemy relationship object
-            from sqlalchemy.orm.relationships import _RelationshipDeclared
+        class TestContext(DbContext):
+            orders: DbSet[RelTestOrder]
+            lines: DbSet[RelTestOrderLine]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(RelTestOrder).has_key(lambda o: o.id).has_many(
+                    lambda o: o.lines
+                ).with_foreign_key(lambda line: line.order_id).backpopulates(
+                    lambda line: line.order
+                ).cascade("all, delete-orphan")
+                builder.entity(RelTestOrderLine).has_key(lambda line: line.id).has_one(
+                    lambda line: line.order
+                ).with_foreign_key(lambda line: line.order_id).backpopulates(
+                    lambda o: o.lines
+                ).with_passive_deletes(False).cascade("save-update, merge, delete")
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+        ctx = TestContext(provider)
+        try:
+            assert inspect(RelTestOrder).relationships["lines"].passive_deletes is True
+            assert inspect(RelTestOrderLine).relationships["order"].passive_deletes is False
 
-            assert isinstance(user_rel, _RelationshipDeclared)
+            # the database deletes the lines of a deleted order
+            (foreign_key,) = RelTestOrderLine.__table__.c.order_id.foreign_keys
+            assert foreign_key.ondelete == "CASCADE"
+        finally:
+            ctx.dispose()
+
+    def test_loader_option_requires_applied_relationship(self) -> None:
+        """Loader options can't be built before the relationship is applied"""
+        builder = DbBuilder(MetaData())
+        rel_config = (
+            builder.entity(RelTestUser).has_many(lambda u: u.posts).with_foreign_key(lambda p: p.user_id)
+        )
+
+        with pytest.raises(RuntimeError, match="has not been applied yet"):
+            rel_config.loader_option()
+
+    def test_resolves_optional_forward_reference(self) -> None:
+        """Optional forward references should resolve to the related entity"""
+
+        class TestContext(DbContext):
+            posts: DbSet[RelTestPostBidir]
+            comments: DbSet[RelTestComment]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(RelTestPostBidir).has_key(lambda p: p.id)
+                builder.entity(RelTestComment).has_key(lambda c: c.id).has_one(
+                    lambda c: c.post
+                ).with_foreign_key(lambda c: c.post_id)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+        ctx = TestContext(provider)
+        try:
+            assert inspect(RelTestComment).relationships["post"].mapper.class_ is RelTestPostBidir
         finally:
             ctx.dispose()
 
@@ -581,20 +840,10 @@ class TestRelationshipCreation:
         provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
         ctx = TestContext(provider)
         try:
-            # verify both relationships were created
-            assert hasattr(RelTestUserBidir, "posts")
-            assert hasattr(RelTestPostBidir, "user")
-
-            # verify relationships are SQLAlchemy relationship objects with back_populates configured
-            from sqlalchemy.orm.relationships import _RelationshipDeclared
-
-            user_posts_rel = getattr(RelTestUserBidir, "posts")
-            post_user_rel = getattr(RelTestPostBidir, "user")
+            # verify both relationships were mapped with back_populates configured
+            user_posts_rel = inspect(RelTestUserBidir).relationships["posts"]
+            post_user_rel = inspect(RelTestPostBidir).relationships["user"]
 
-            assert isinstance(user_posts_rel, _RelationshipDeclared)
-            assert isinstance(post_user_rel, _RelationshipDeclared)
-
-            # verify back_populates is configured
             assert user_posts_rel.back_populates == "user"
             assert post_user_rel.back_populates == "posts"
         finally:
@@ -646,10 +895,10 @@ class TestBuilderFinalize:
             def setup(self, builder: DbBuilder) -> None:
                 builder.entity(RelTestUserBidir).has_key(lambda u: u.id).has_many(
                     lambda u: u.posts
-                ).with_foreign_key(lambda p: p.user_id)
+                ).with_foreign_key(lambda p: p.user_id).backpopulates(lambda p: p.user)
                 builder.entity(RelTestPostBidir).has_key(lambda p: p.id).has_one(
                     lambda p: p.user
-                ).with_foreign_key(lambda p: p.user_id)
+                ).with_foreign_key(lambda p: p.user_id).backpopulates(lambda u: u.posts)
 
         provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
         ctx = TestContext(provider)
@@ -1077,3 +1326,18 @@ class TestRelationshipValidation:
         provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
         with pytest.raises(AttributeError, match="Property 'user_id' does not exist"):
             TestContext(provider)
+
+    def test_validates_foreign_key_is_configured(self) -> None:
+        """Should raise error if a non-M:M relationship has no foreign key"""
+
+        class TestContext(DbContext):
+            users: DbSet[ValTestUser]
+            posts: DbSet[ValTestPost]
+
+            def setup(self, builder: DbBuilder) -> None:
+                builder.entity(ValTestUser).has_key(lambda u: u.id).has_many(lambda u: u.posts)
+                builder.entity(ValTestPost).has_key(lambda p: p.id)
+
+        provider = InMemoryProvider(InMemoryEngineOptions(use_async=False))
+        with pytest.raises(ValueError, match="No foreign key is configured"):
+            TestContext(provider)
@@ -27,6 +27,56 @@ class TestDbContextInitialization:
 
         assert isinstance(db_context.users, DbSet)
 
+    def test_dbsets_created_on_first_access(self, db_context: SampleDbContext) -> None:
+        """DbSets are created lazily and reused on later accesses"""
+        assert "users" not in vars(db_context)
+        users = db_context.users
+        assert db_context.users is users
+
+    def test_dbset_specs_collected_per_subclass(self) -> None:
+        """DbSet annotations are collected once, when the context class is defined"""
+        from tests.conftest import TestUser
+
+        assert SampleDbContext._dbset_specs == {"users": TestUser}
+
+    def test_dbsets_inherited_from_base_context(
+        self, in_memory_provider: InMemoryProvider
+    ) -> None:
+        """A context subclass inherits the DbSets declared on its base context"""
+        from effigy.dbset import DbSet
+
+        class InheritedDbContext(SampleDbContext):
+            pass
+
+        ctx = InheritedDbContext(in_memory_provider)
+        try:
+            assert "users" in InheritedDbContext._dbset_specs
+            assert isinstance(ctx.users, DbSet)
+        finally:
+            ctx.dispose()
+
+    def test_dbset_rejects_undecorated_type(self, db_context: SampleDbContext) -> None:
+        """DbSet raises TypeError for types not decorated with @entity"""
+        from effigy.dbset import DbSet
+
+        class NotAnEntity:
+            __tablename__ = "not_an_entity"
+
+        with pytest.raises(TypeError, match="Did you forget the @entity decorator"):
+            DbSet(NotAnEntity, db_context)
+
+    def test_dbset_for_unconfigured_entity(self, db_context: SampleDbContext) -> None:
+        """A DbSet for an entity not configured in setup() fails clearly when used"""
+        from effigy.dbset import DbSet
+        from effigy.entity import entity
+
+        @entity
+        class Unconfigured:
+            id: int
+
+        dbset = DbSet(Unconfigured, db_context)
+        with db_context, pytest.raises(RuntimeError, match="Unconfigured is not configured"):
+            dbset.to_list()
 
 class TestDbContextSession:
     """Tests for DbContext session management"""
@@ -63,6 +113,19 @@ class TestDbContextSaveChanges:
 
             assert isinstance(change_count, int)
 
+    def test_save_changes_defers_until_batch_is_full(self, db_context: SampleDbContext) -> None:
+        """save_changes(batch_size=n) only commits once n operations are pending"""
+        from tests.conftest import TestUser
+
+        with db_context:
+            for i in range(1, 3):
+                db_context.users.add(TestUser(id=i, name=f"user{i}", email=f"user{i}@example.com"))
+                assert db_context.save_changes(batch_size=3) == 0
+
+            db_context.users.add(TestUser(id=3, name="user3", email="user3@example.com"))
+            assert db_context.save_changes(batch_size=3) == 3
+            assert db_context._pending_ops == 0
+
 
 class TestDbContextContextManager:
     """Tests for DbContext context manager protocol"""
@@ -95,6 +158,11 @@ class TestDbContextContextManager:
 
         assert session_before is not None
 
+    def test_exit_without_session_is_noop(self, db_context: SampleDbContext) -> None:
+        """__exit__ does nothing when no session was opened"""
+        db_context.__exit__(None, None, None)
+        assert db_context._session is None
+
 
 class TestDbContextDispose:
     """Tests for DbContext dispose method"""
@@ -116,3 +184,34 @@ class TestDbContextDispose:
         context.dispose()
 
         assert True
+
+    def test_contexts_share_engine_per_provider(self, in_memory_provider: InMemoryProvider) -> None:
+        """Contexts from the same provider share one engine until the last is disposed"""
+        from effigy.context import _ENGINES
+
+        first = SampleDbContext(in_memory_provider)
+        second = SampleDbContext(in_memory_provider)
+        assert first._engine is second._engine
+
+        first.dispose()
+        assert in_memory_provider in _ENGINES
+
+        second.dispose()
+        assert in_memory_provider not in _ENGINES
+
+    def test_failed_setup_releases_engine(self, in_memory_provider: InMemoryProvider) -> None:
+        """A context whose setup() fails doesn't keep a hold on the shared engine"""
+        from effigy.builder.core import DbBuilder
+        from effigy.context import _ENGINES
+
+        class BrokenDbContext(SampleDbContext):
+            def setup(self, builder: DbBuilder) -> None:
+                raise ValueError("broken setup")
+
+        with pytest.raises(ValueError, match="broken setup"):
+            BrokenDbContext(in_memory_provider)
+        assert in_memory_provider not in _ENGINES
+
+        context = SampleDbContext(in_memory_provider)
+        context.dispose()
+        assert in_memory_provider not in _ENGINES
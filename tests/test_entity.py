@@ -1,6 +1,9 @@
 from typing import Any
 
+import pytest
+
 from effigy.entity import (
+    _get_entity_proxy,
     _pluralize,
     entity,
 )
@@ -49,6 +52,20 @@ class TestEntityDecorator:
 
         assert getattr(User, "__tablename__", None) == "custom_users"
 
+    def test_entity_subclass_gets_own_tablename(self) -> None:
+
+        @entity
+        class User:
+            id: int
+            name: str
+
+        @entity
+        class Admin(User):
+            level: int
+
+        assert getattr(Admin, "__tablename__", None) == "admins"
+        assert Admin.__dict__["__table__"] is None
+
     def test_entity_decorator_adds_list_factory(self) -> None:
 
         @entity
@@ -94,6 +111,30 @@ class TestEntityDecorator:
         assert "tag1" in user.tags
         assert "tag1" not in user2.tags
 
+    def test_entity_decorator_adds_immutable_collection_factories(self) -> None:
+
+        @entity
+        class User:
+            id: int
+            roles: frozenset[str]
+            aliases: tuple[str, ...]
+
+        user = User(1)
+
+        assert user.roles == frozenset()
+        assert user.aliases == ()
+
+    def test_entity_decorator_requires_fixed_length_tuple(self) -> None:
+
+        @entity
+        class Point:
+            id: int
+            xy: tuple[int, int]
+
+        with pytest.raises(TypeError):
+            Point(1)  # type: ignore[call-arg]
+        assert Point(1, (2, 3)).xy == (2, 3)
+
     def test_entity_decorator_creates_dict_class(self) -> None:
         """Entities use __dict__ (not __slots__) to support SQLAlchemy instrumentation."""
 
@@ -108,6 +149,19 @@ class TestEntityDecorator:
         # Should not have __slots__ since we're using slots=False
         assert getattr(User, "__slots__", None) is None
 
+    def test_entity_decorator_keeps_own_post_init(self) -> None:
+        """A post-init hook declared on the class still runs"""
+
+        @entity
+        class User:
+            id: int
+            name: str
+
+            def __attrs_post_init__(self) -> None:
+                self.name = self.name.strip()
+
+        assert User(1, " Alice ").name == "Alice"
+
     def test_entity_satisfies_protocol(self) -> None:
 
         @entity
@@ -118,6 +172,35 @@ class TestEntityDecorator:
         assert getattr(User, "__tablename__", None) is not None
 
 
+class TestEntityProxy:
+    """Tests for the navigation proxy"""
+
+    def test_proxy_is_shared_per_entity_type(self) -> None:
+        @entity
+        class User:
+            id: int
+            name: str
+
+        proxy = _get_entity_proxy(User)
+        # built by the decorator, then reused
+        assert vars(User)["__effigy_proxy__"] is proxy
+        assert _get_entity_proxy(User) is proxy
+        assert proxy.name.key == "name"
+
+        with pytest.raises(AttributeError, match="Cannot set attribute"):
+            proxy.name = "Alice"
+
+    def test_proxy_rejects_undeclared_properties(self) -> None:
+        @entity
+        class User:
+            id: int
+            name: str
+
+        proxy = _get_entity_proxy(User)
+        with pytest.raises(AttributeError, match="Property 'email' does not exist on entity User"):
+            _ = proxy.email
+
+
 class TestPluralizeFunction:
     """Tests for the _pluralize helper function"""
 
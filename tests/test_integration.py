@@ -1,7 +1,10 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Generator
 
 import pytest
-from sqlalchemy import inspect
+from sqlalchemy import Engine, event, inspect, select
+from sqlalchemy.exc import IntegrityError
 
 from effigy.builder.core import DbBuilder
 from effigy.context import AsyncDbContext, DbContext
@@ -43,11 +46,11 @@ class IntegrationDbContext(DbContext):
         """Configure entities with keys and relationships"""
         builder.entity(Author).has_key(lambda a: a.id).has_many(lambda a: a.posts).with_foreign_key(
             lambda p: p.author_id
-        )
+        ).backpopulates(lambda p: p.author)
 
         builder.entity(Post).has_key(lambda p: p.id).has_one(lambda p: p.author).with_foreign_key(
             lambda p: p.author_id
-        )
+        ).backpopulates(lambda a: a.posts)
 
 
 # Async context for integration testing
@@ -61,13 +64,107 @@ class AsyncIntegrationDbContext(AsyncDbContext):
         """Configure entities with keys and relationships"""
         builder.entity(Author).has_key(lambda a: a.id).has_many(lambda a: a.posts).with_foreign_key(
             lambda p: p.author_id
-        )
+        ).backpopulates(lambda p: p.author)
 
         builder.entity(Post).has_key(lambda p: p.id).has_one(lambda p: p.author).with_foreign_key(
             lambda p: p.author_id
+        ).backpopulates(lambda a: a.posts)
+
+
+@entity
+class Team:
+    """Team entity whose players are joined eager loaded"""
+
+    id: int
+    name: str
+    players: list["Player"]
+
+
+@entity
+class Player:
+    """Player entity whose team is loaded on access"""
+
+    id: int
+    name: str
+    team_id: int
+    team: Team | None = None
+
+
+class TeamDbContext(DbContext):
+    """DbContext with a joined eager loaded collection and a lazy loaded reference"""
+
+    teams: DbSet[Team]
+    players: DbSet[Player]
+
+    def setup(self, builder: DbBuilder) -> None:
+        builder.entity(Team).has_key(lambda t: t.id).has_many(lambda t: t.players).with_foreign_key(
+            lambda p: p.team_id
+        ).backpopulates(lambda p: p.team).with_lazy_loading("joined")
+
+        self.player_team = (
+            builder.entity(Player)
+            .has_key(lambda p: p.id)
+            .has_one(lambda p: p.team)
+            .with_foreign_key(lambda p: p.team_id)
+            .backpopulates(lambda t: t.players)
+            .with_lazy_loading()
         )
 
 
+@entity
+class Invoice:
+    """Invoice entity whose lines are deleted along with it"""
+
+    id: int
+    lines: list["InvoiceLine"]
+
+
+@entity
+class InvoiceLine:
+    """Invoice line entity"""
+
+    id: int
+    invoice_id: int
+    invoice: Invoice | None = None
+
+
+class InvoiceDbContext(DbContext):
+    """DbContext with a lazy loaded collection that cascades deletes"""
+
+    invoices: DbSet[Invoice]
+    lines: DbSet[InvoiceLine]
+
+    def setup(self, builder: DbBuilder) -> None:
+        self.invoice_lines = (
+            builder.entity(Invoice)
+            .has_key(lambda i: i.id)
+            .has_many(lambda i: i.lines)
+            .with_foreign_key(lambda line: line.invoice_id)
+            .backpopulates(lambda line: line.invoice)
+            .cascade("all, delete-orphan")
+            .with_lazy_loading()
+        )
+
+        builder.entity(InvoiceLine).has_key(lambda line: line.id).has_one(
+            lambda line: line.invoice
+        ).with_foreign_key(lambda line: line.invoice_id).backpopulates(lambda i: i.lines)
+
+
+@contextmanager
+def _record_statements(engine: Engine) -> Iterator[list[str]]:
+    """Records the SQL statements executed on an engine"""
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def integration_context(
     in_memory_provider: InMemoryProvider,
@@ -101,6 +198,24 @@ def async_integration_context(
             loop.close()
 
 
+@pytest.fixture
+def team_context(in_memory_provider: InMemoryProvider) -> Generator[TeamDbContext, None, None]:
+    """Provides a TeamDbContext instance with automatic cleanup"""
+    ctx = TeamDbContext(in_memory_provider)
+    yield ctx
+    ctx.dispose()
+
+
+@pytest.fixture
+def invoice_context(
+    in_memory_provider: InMemoryProvider,
+) -> Generator[InvoiceDbContext, None, None]:
+    """Provides an InvoiceDbContext instance with automatic cleanup"""
+    ctx = InvoiceDbContext(in_memory_provider)
+    yield ctx
+    ctx.dispose()
+
+
 class TestDatabaseSchemaCreation:
     """Tests that verify database tables and schema are correctly created"""
 
@@ -191,6 +306,50 @@ class TestSyncCRUDOperations:
             names = {a.name for a in authors}
             assert names == {"Alice", "Bob"}
 
+    def test_add_range_inserts_all_entities(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """add_range() inserts every entity in the iterable"""
+        with integration_context as ctx:
+            ctx.authors.add_range(
+                Author(id=i, name=f"Author {i}", email=f"author{i}@example.com", posts=[])
+                for i in range(1, 4)
+            )
+
+        with integration_context as ctx:
+            authors = ctx.authors.to_list()
+            assert sorted(a.id for a in authors) == [1, 2, 3]
+
+    def test_save_changes_bulk_inserts_rows(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """save_changes_bulk() inserts plain rows and commits them"""
+        rows = [
+            {"id": i, "name": f"Author {i}", "email": f"author{i}@example.com"} for i in range(5)
+        ]
+
+        with integration_context as ctx:
+            assert ctx.save_changes_bulk(Author, rows) == 5
+
+        with integration_context as ctx:
+            authors = ctx.authors.to_list()
+            assert sorted(a.id for a in authors) == [0, 1, 2, 3, 4]
+
+    def test_save_changes_bulk_rejects_unconfigured_entity(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """save_changes_bulk() fails clearly for entities the context doesn't configure"""
+
+        @entity
+        class Unconfigured:
+            id: int
+
+        with (
+            integration_context as ctx,
+            pytest.raises(RuntimeError, match="Unconfigured is not configured"),
+        ):
+            ctx.save_changes_bulk(Unconfigured, [{"id": 1}])
+
     def test_query_entities_from_database(self, integration_context: IntegrationDbContext) -> None:
         """Query entities back from database"""
         # Insert test data
@@ -262,6 +421,24 @@ class TestSyncQueryOperations:
             assert len(alice) == 1
             assert alice[0].name == "Alice"
 
+    def test_query_reuses_compiled_statement_until_changed(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """The compiled statement is reused across executions and rebuilt after changes"""
+        with integration_context as ctx:
+            ctx.authors.add(Author(id=1, name="Alice", email="alice@example.com", posts=[]))
+            ctx.authors.add(Author(id=2, name="Bob", email="bob@example.com", posts=[]))
+
+        with integration_context as ctx:
+            query = ctx.authors.where(lambda a: a.id > 0)
+            assert query.any()
+            compiled = query._compile()
+            assert query._compile() is compiled
+
+            bob = query.where(lambda a: a.name == "Bob").to_list()
+            assert query._compile() is not compiled
+            assert [a.name for a in bob] == ["Bob"]
+
     def test_dbset_iteration(self, integration_context: IntegrationDbContext) -> None:
         """DbSet can be iterated over"""
         with integration_context as ctx:
@@ -315,6 +492,51 @@ class TestSyncRelationshipOperations:
             assert len(authors) == 1
             assert authors[0].name == "Alice"
 
+    def test_reference_keeps_foreign_key_given_to_constructor(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """A reference left as None doesn't clear the foreign key passed next to it"""
+        with integration_context as ctx:
+            ctx.authors.add(Author(id=1, name="Alice", email="alice@example.com", posts=[]))
+            ctx.posts.add(Post(id=1, title="First Post", content="Hello", author_id=1, author=None))
+
+        with integration_context as ctx:
+            (post,) = ctx.posts.to_list()
+            assert post.author is not None
+            assert post.author.name == "Alice"
+
+    def test_collections_load_in_one_batched_query(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """Collections are selectin loaded with the entities instead of one query per entity"""
+        with integration_context as ctx:
+            for author_id in range(1, 4):
+                post = Post(
+                    id=author_id, title="Post", content="Hello", author_id=author_id, author=None
+                )
+                ctx.authors.add(
+                    Author(id=author_id, name="Author", email="a@example.com", posts=[post])
+                )
+
+        with integration_context as ctx, _record_statements(ctx._engine) as statements:
+            authors = ctx.authors.to_list()
+            assert [len(a.posts) for a in authors] == [1, 1, 1]
+            assert len(statements) == 2
+
+    def test_references_load_with_a_join(self, integration_context: IntegrationDbContext) -> None:
+        """Many-to-one references are joined into the query that loads the entities"""
+        with integration_context as ctx:
+            posts = [
+                Post(id=i, title="Post", content="Hello", author_id=1, author=None)
+                for i in range(1, 4)
+            ]
+            ctx.authors.add(Author(id=1, name="Alice", email="alice@example.com", posts=posts))
+
+        with integration_context as ctx, _record_statements(ctx._engine) as statements:
+            posts = ctx.posts.to_list()
+            assert {p.author.name for p in posts if p.author is not None} == {"Alice"}
+            assert len(statements) == 1
+
 
 class TestAsyncCRUDOperations:
     """Tests for async CRUD operations"""
@@ -335,6 +557,20 @@ class TestAsyncCRUDOperations:
             assert len(authors) == 1
             assert authors[0].name == "Alice"
 
+    @pytest.mark.asyncio
+    async def test_async_save_changes_bulk(
+        self, async_integration_context: AsyncIntegrationDbContext
+    ) -> None:
+        """Bulk insert rows using async context"""
+        rows = [{"id": 1, "name": "Alice", "email": "alice@example.com"}]
+
+        async with async_integration_context as ctx:
+            assert await ctx.save_changes_bulk(Author, rows) == 1
+
+        async with async_integration_context as ctx:
+            authors = await ctx.authors.to_list()
+            assert [a.name for a in authors] == ["Alice"]
+
     @pytest.mark.asyncio
     async def test_async_query_entities(
         self, async_integration_context: AsyncIntegrationDbContext
@@ -441,11 +677,123 @@ class TestEdgeCases:
         with integration_context as ctx:
             ctx.authors.add(Author(id=1, name="Alice", email="alice@example.com", posts=[]))
             change_count = ctx.save_changes()
-            # Note: change_count may be 0 due to flush() clearing the session state
-            # before counting. The important part is that save_changes() succeeds.
-            assert isinstance(change_count, int)
+            assert change_count == 1
 
         # Verify the change persisted
         with integration_context as ctx:
             authors = ctx.authors.to_list()
             assert len(authors) == 1
+
+    def test_save_changes_rolls_back_on_non_database_error(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """save_changes() rolls back and re-raises errors raised by flush hooks"""
+
+        def fail(*args: Any) -> None:
+            raise ValueError("hook failed")
+
+        with integration_context as ctx:
+            session = ctx._get_session()
+            event.listen(session, "before_flush", fail)
+            ctx.authors.add(Author(id=1, name="Alice", email="alice@example.com", posts=[]))
+            with pytest.raises(ValueError, match="hook failed"):
+                ctx.save_changes()
+            assert not session.new
+            event.remove(session, "before_flush", fail)
+
+        with integration_context as ctx:
+            assert ctx.authors.to_list() == []
+
+    def test_save_changes_preserves_database_error(
+        self, integration_context: IntegrationDbContext
+    ) -> None:
+        """save_changes() re-raises the original SQLAlchemy error after rolling back"""
+        with integration_context as ctx:
+            ctx.authors.add(Author(id=1, name="Alice", email="alice@example.com", posts=[]))
+
+        with pytest.raises(IntegrityError), integration_context as ctx:
+            ctx.authors.add(Author(id=1, name="Bob", email="bob@example.com", posts=[]))
+            ctx.save_changes()
+
+        with integration_context as ctx:
+            authors = ctx.authors.to_list()
+            assert [a.name for a in authors] == ["Alice"]
+
+
+class TestRelationshipLoading:
+    """Tests for relationship loader options and loader strategy overrides"""
+
+    def test_loader_option_eager_loads_reference(self, team_context: TeamDbContext) -> None:
+        """loader_option() joins a lazy loaded reference into the query"""
+        with team_context as ctx:
+            players = [Player(id=i, name=f"Player {i}", team_id=1) for i in range(1, 4)]
+            ctx.teams.add(Team(id=1, name="Tigers", players=players))
+
+        with team_context as ctx, _record_statements(ctx._engine) as statements:
+            statement = select(Player).options(ctx.player_team.loader_option())
+            # the team's players are joined eager loaded too, so rows are made unique
+            players = list(ctx._get_session().scalars(statement).unique())
+            assert {p.team.name for p in players if p.team is not None} == {"Tigers"}
+            assert len(statements) == 1
+
+    def test_loader_option_eager_loads_collection(self, invoice_context: InvoiceDbContext) -> None:
+        """loader_option() loads a lazy loaded collection in one batched query"""
+        with invoice_context as ctx:
+            for invoice_id in range(1, 4):
+                line = InvoiceLine(id=invoice_id, invoice_id=invoice_id)
+                ctx.invoices.add(Invoice(id=invoice_id, lines=[line]))
+
+        with invoice_context as ctx, _record_statements(ctx._engine) as statements:
+            statement = select(Invoice).options(ctx.invoice_lines.loader_option())
+            invoices = list(ctx._get_session().scalars(statement))
+            assert [len(i.lines) for i in invoices] == [1, 1, 1]
+            assert len(statements) == 2
+
+    def test_lazy_loading_override(self, team_context: TeamDbContext) -> None:
+        """with_lazy_loading() loads the reference on first access instead"""
+        with team_context as ctx:
+            ctx.teams.add(Team(id=1, name="Tigers", players=[Player(id=1, name="A", team_id=1)]))
+
+        with team_context as ctx, _record_statements(ctx._engine) as statements:
+            (player,) = ctx.players.to_list()
+            assert len(statements) == 1
+            assert player.team is not None
+            assert len(statements) == 2
+
+    def test_iteration_buffers_joined_collections(self, team_context: TeamDbContext) -> None:
+        """Iterating doesn't stream rows when a joined collection loader is configured"""
+        with team_context as ctx:
+            players = [Player(id=1, name="A", team_id=1), Player(id=2, name="B", team_id=1)]
+            ctx.teams.add(Team(id=1, name="Tigers", players=players))
+
+        with team_context as ctx:
+            teams = list(ctx.teams)
+            assert [t.id for t in teams] == [1]
+            assert len(teams[0].players) == 2
+            assert [t.id for t in ctx.teams.to_list()] == [1]
+
+    def test_iteration_requires_session(self, team_context: TeamDbContext) -> None:
+        """Iterating outside of `with` fails when the iterator is created"""
+        with pytest.raises(RuntimeError, match="Session not initialized"):
+            iter(team_context.players)
+
+    def test_passive_deletes_leave_children_to_the_database(
+        self, invoice_context: InvoiceDbContext
+    ) -> None:
+        """Deleting an entity doesn't load its unloaded children to delete them one by one"""
+        with invoice_context._engine.connect() as conn:
+            # sqlite only enforces foreign keys (and their ON DELETE actions) when enabled
+            conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+        with invoice_context as ctx:
+            lines = [InvoiceLine(id=1, invoice_id=1), InvoiceLine(id=2, invoice_id=1)]
+            ctx.invoices.add(Invoice(id=1, lines=lines))
+
+        with invoice_context as ctx, _record_statements(ctx._engine) as statements:
+            (invoice,) = ctx.invoices.to_list()
+            ctx.invoices.remove(invoice)
+            ctx.save_changes()
+            assert not any("FROM invoicelines" in statement for statement in statements)
+
+        with invoice_context as ctx:
+            assert ctx.lines.to_list() == []
@@ -1,10 +1,17 @@
 import pytest
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any
 
-from effigy.provider.base import DatabaseProvider
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+from effigy.provider.base import BaseEngineOptions, DatabaseProvider
+from effigy.provider.factory import ProviderFactory
 from effigy.provider.memory import InMemoryProvider, InMemoryEngineOptions
+from effigy.provider.mysql import MySqlProvider, MySqlEngineOptions
+from effigy.provider.pg import PostgresProvider, PostgresEngineOptions
 
 
 class TestDatabaseProviderProtocol:
@@ -65,3 +72,81 @@ class TestInMemoryProviderConfig(ProviderConfigTestBase):
         """Helper method to get engine options for testing"""
         provider = InMemoryProvider(InMemoryEngineOptions(use_async=use_async))
         return provider.get_engine_options()
+
+
+class TestProviderFactory:
+    """Tests for ProviderFactory"""
+
+    def test_create_provider_by_type(self) -> None:
+        """create_provider instantiates the provider registered for the type"""
+        provider = ProviderFactory.create_provider("inmemory", InMemoryEngineOptions())
+        assert isinstance(provider, InMemoryProvider)
+
+    def test_providers_registry_is_read_only(self) -> None:
+        """The provider registry is exposed read-only"""
+        assert ProviderFactory.providers["postgres"] is PostgresProvider
+        with pytest.raises(TypeError):
+            ProviderFactory.providers["inmemory"] = MySqlProvider  # type: ignore[index]
+
+    def test_create_provider_unknown_type(self) -> None:
+        """create_provider raises ValueError for unknown provider types"""
+        with pytest.raises(ValueError, match="Unknown provider type"):
+            ProviderFactory.create_provider("oracle", InMemoryEngineOptions())  # type: ignore[arg-type]
+
+
+class TestServerProviderConfig:
+    """Tests for MySqlProvider and PostgresProvider connection strings"""
+
+    def test_mysql_connection_string_quotes_password(self) -> None:
+        """MySqlProvider URL-encodes the password in the connection string"""
+        provider = MySqlProvider(
+            MySqlEngineOptions(host="db", database="app", username="u", password="p@ss")
+        )
+        assert provider.get_connection_string() == "mysql+pymysql://u:p%40ss@db:3306/app"
+
+    def test_postgres_connection_string_async(self) -> None:
+        """PostgresProvider uses the asyncpg driver in async mode"""
+        provider = PostgresProvider(
+            PostgresEngineOptions(
+                host="db", database="app", username="u", password="pw", use_async=True
+            )
+        )
+        assert provider.get_connection_string() == "postgresql+asyncpg://u:pw@db:5432/app"
+
+
+class TestBaseEngineOptions:
+    """Tests for the shared engine options"""
+
+    def test_pre_ping_reaches_the_engine(self, tmp_path: Path) -> None:
+        """pool_preping is passed to create_engine under its SQLAlchemy name"""
+        opts = BaseEngineOptions(pool_preping=True).to_engine_opts()
+
+        assert opts["pool_pre_ping"] is True
+        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", **opts)
+        try:
+            assert engine.pool._pre_ping
+        finally:
+            engine.dispose()
+
+    def test_non_queue_poolclass_omits_pool_sizing(self) -> None:
+        """An engine can be built with a pool that doesn't accept queue sizing arguments"""
+        opts = BaseEngineOptions(poolclass=NullPool).to_engine_opts()
+
+        assert "pool_size" not in opts
+        engine = create_engine("sqlite://", **opts)
+        try:
+            assert isinstance(engine.pool, NullPool)
+        finally:
+            engine.dispose()
+
+    def test_default_pool_is_sized(self, tmp_path: Path) -> None:
+        """Queue pool sizing arguments are passed when no poolclass is set"""
+        opts = BaseEngineOptions(pool_size=3).to_engine_opts()
+
+        # file databases use a QueuePool by default
+        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", **opts)
+        try:
+            assert isinstance(engine.pool, QueuePool)
+            assert engine.pool.size() == 3
+        finally:
+            engine.dispose()